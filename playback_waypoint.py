@@ -29,19 +29,48 @@ Examples:
 import os
 import time
 import json
+import mmap
 import sys
+import queue
+import threading
 import argparse
-import glob
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 
-from robot import Robot
+import numpy as np
+
+try:
+    import orjson  # Fast C/Rust JSON parser, optional
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Streaming JSON parser, optional
+except ImportError:
+    ijson = None
+
+# Note: `from robot import Robot` is deferred to main() so list-only
+# invocations don't pay for importing the serial/servo stack
+
+# Files larger than this are memory-mapped instead of read into a string
+MMAP_THRESHOLD = 1_000_000
+
+# Commands handed from the producer to the serial consumer per queue slot
+PLAYBACK_CHUNK = 16
+
+# In-process LRU of parsed waypoint files keyed by (abspath, mtime_ns,
+# size), so rebuilding a player for the same file skips the reparse.
+# Entries are (metadata, positions, ids, timestamps) and treated as
+# read-only by all consumers.
+_WP_CACHE = OrderedDict()
+_WP_CACHE_MAX = 8
 
 class WaypointPlayer:
     """
     Plays back recorded robot waypoints from JSON files.
     """
     
-    def __init__(self, robot: Robot):
+    def __init__(self, robot: "Robot"):
         """
         Initialize the waypoint player.
         
@@ -49,19 +78,201 @@ class WaypointPlayer:
             robot: Connected Robot instance
         """
         self.robot = robot
-        self.waypoint_data = None
-        self.waypoints = []
-        
+        self.metadata = {}
+        self.positions = None    # (N, n_joints) int16 matrix
+        self.ids = None          # (N,) waypoint ids
+        self.timestamps = None   # (N,) timestamp strings
+
+    def _iter_waypoint_files(self):
+        """
+        Iterate over waypoint JSON files in the current directory.
+
+        One os.scandir pass replaces the two glob passes, and the yielded
+        DirEntry objects carry cached stat results so callers get
+        size/mtime without extra syscalls.
+
+        Yields:
+            os.DirEntry: Directory entry for each waypoint file
+        """
+        with os.scandir('.') as it:
+            for entry in it:
+                name = entry.name
+                if (name.endswith(('.json', '.jsonl'))
+                        and not name.endswith('.meta.json')
+                        and (name.startswith('waypoints_') or 'waypoint' in name)
+                        and entry.is_file()):
+                    yield entry
+
     def list_waypoint_files(self) -> List[str]:
         """
         List all available waypoint JSON files in current directory.
-        
+
         Returns:
             list: List of waypoint filenames
         """
-        waypoint_files = glob.glob("waypoints_*.json") + glob.glob("*waypoint*.json")
-        return sorted(waypoint_files)
+        return sorted(entry.name for entry in self._iter_waypoint_files())
     
+    def _load_cached(self, filename: str, stat: os.stat_result) -> bool:
+        """
+        Try to load waypoint arrays from the .cache.npz sidecar file.
+
+        The cache stores positions as a single integer matrix plus the
+        metadata blob, keyed by the source file's (mtime_ns, size) so a
+        modified source file invalidates it automatically.
+
+        Args:
+            filename: Path to waypoint JSON file
+            stat: os.stat result for the source file
+
+        Returns:
+            bool: True on cache hit, False on miss
+        """
+        cache_file = filename + '.cache.npz'
+        if not os.path.exists(cache_file):
+            return False
+
+        try:
+            with np.load(cache_file, allow_pickle=False) as npz:
+                key = npz['key']
+                if int(key[0]) != stat.st_mtime_ns or int(key[1]) != stat.st_size:
+                    return False
+
+                self.positions = npz['positions'].astype(np.int16, copy=False)
+                self.ids = npz['ids']
+                self.timestamps = npz['timestamps']
+                self.metadata = json.loads(npz['metadata'].item())
+            return True
+        except Exception:
+            return False  # Corrupt/stale cache, fall back to JSON parse
+
+    def _save_cache(self, filename: str, stat: os.stat_result):
+        """
+        Write the .cache.npz sidecar so the next load skips JSON parsing.
+
+        Failures (e.g. read-only directory) are silently ignored; the
+        cache is purely an optimization.
+
+        Args:
+            filename: Path to waypoint JSON file
+            stat: os.stat result for the source file
+        """
+        try:
+            np.savez(filename + '.cache.npz',
+                     key=np.asarray([stat.st_mtime_ns, stat.st_size], dtype=np.int64),
+                     positions=self.positions, ids=self.ids,
+                     timestamps=self.timestamps,
+                     metadata=np.array(json.dumps(self.metadata)))
+        except Exception:
+            pass
+
+    def _parse_jsonl(self, filename: str) -> Dict[str, Any]:
+        """
+        Parse a JSONL waypoint log written by record_waypoint.py.
+
+        Each line is one waypoint; session metadata lives in the
+        <file>.meta.json sidecar and is reconstructed from the waypoints
+        themselves if the sidecar is missing.
+
+        Args:
+            filename: Path to waypoint JSONL file
+
+        Returns:
+            dict: Parsed waypoint data
+        """
+        loads = orjson.loads if orjson is not None else json.loads
+
+        waypoints = []
+        with open(filename, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    waypoints.append(loads(line))
+
+        meta_file = filename + '.meta.json'
+        if os.path.exists(meta_file):
+            with open(meta_file, 'rb') as f:
+                metadata = loads(f.read())
+        else:
+            metadata = {'total_waypoints': len(waypoints)}
+            if waypoints and 'joint_names' in waypoints[0]:
+                metadata['joint_names'] = waypoints[0]['joint_names']
+
+        return {'metadata': metadata, 'waypoints': waypoints}
+
+    def _stream_parse(self, filename: str) -> Dict[str, Any]:
+        """
+        Stream-parse a waypoint JSON file with ijson.
+
+        Waypoints are shape-checked one at a time as they are decoded, so
+        a malformed waypoint aborts the load without materializing or
+        parsing the rest of the array.
+
+        Args:
+            filename: Path to waypoint JSON file
+
+        Returns:
+            dict: Parsed waypoint data
+
+        Raises:
+            ValueError: If a waypoint has the wrong number of positions
+        """
+        expected_joints = None
+        if self.robot is not None and self.robot.has_calibration():
+            expected_joints = len(self.robot.calibration)
+
+        with open(filename, 'rb') as f:
+            metadata = next(ijson.items(f, 'metadata'), {})
+            f.seek(0)
+
+            waypoints = []
+            for i, waypoint in enumerate(ijson.items(f, 'waypoints.item')):
+                positions = waypoint.get('positions', [])
+                if expected_joints is not None and len(positions) != expected_joints:
+                    raise ValueError(
+                        f"waypoint {i+1} has {len(positions)} positions, "
+                        f"expected {expected_joints}"
+                    )
+                waypoints.append(waypoint)
+
+        return {'metadata': metadata, 'waypoints': waypoints}
+
+    def _parse_file(self, filename: str, size: int) -> Dict[str, Any]:
+        """
+        Parse a waypoint JSON file into a dict.
+
+        Large files are memory-mapped and fed to the parser directly,
+        avoiding a full userspace copy of the file contents. Small files
+        use a plain read, and mmap failures fall back to it as well.
+
+        Args:
+            filename: Path to waypoint JSON file
+            size: File size in bytes, from the caller's stat
+
+        Returns:
+            dict: Parsed waypoint data
+        """
+        if filename.endswith('.jsonl'):
+            return self._parse_jsonl(filename)
+
+        if ijson is not None:
+            return self._stream_parse(filename)
+
+        loads = orjson.loads if orjson is not None else json.loads
+
+        with open(filename, 'rb') as f:
+            if size > MMAP_THRESHOLD:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        if orjson is not None:
+                            return loads(memoryview(mm))
+                        return loads(mm[:])
+                    finally:
+                        mm.close()
+                except (ValueError, OSError):
+                    pass  # Empty file or mmap unsupported, fall through
+            return loads(f.read())
+
     def load_waypoints(self, filename: str) -> bool:
         """
         Load waypoints from JSON file.
@@ -73,36 +284,77 @@ class WaypointPlayer:
             bool: True if loaded successfully, False otherwise
         """
         try:
-            if not os.path.exists(filename):
+            try:
+                stat = os.stat(filename)
+            except FileNotFoundError:
                 print(f"✗ Waypoint file not found: {filename}")
                 return False
-            
-            with open(filename, 'r') as f:
-                self.waypoint_data = json.load(f)
-            
-            # Validate file structure
-            if 'waypoints' not in self.waypoint_data:
-                print(f"✗ Invalid waypoint file format: missing 'waypoints' key")
-                return False
-            
-            self.waypoints = self.waypoint_data['waypoints']
-            
-            if not self.waypoints:
+            cache_key = (os.path.abspath(filename), stat.st_mtime_ns, stat.st_size)
+
+            if cache_key in _WP_CACHE:
+                _WP_CACHE.move_to_end(cache_key)
+                (self.metadata, self.positions,
+                 self.ids, self.timestamps) = _WP_CACHE[cache_key]
+            elif not self._load_cached(filename, stat):
+                data = self._parse_file(filename, stat.st_size)
+
+                # Validate file structure
+                if 'waypoints' not in data:
+                    print(f"✗ Invalid waypoint file format: missing 'waypoints' key")
+                    return False
+
+                # Convert to struct-of-arrays: one contiguous position
+                # matrix plus parallel id/timestamp arrays
+                waypoints = data['waypoints']
+                self.metadata = data.get('metadata', {})
+                if waypoints:
+                    self.positions = np.asarray(
+                        [wp['positions'] for wp in waypoints], dtype=np.int16
+                    ).reshape(len(waypoints), -1)
+                    self.ids = np.asarray(
+                        [wp.get('id', i + 1) for i, wp in enumerate(waypoints)],
+                        dtype=np.int64
+                    )
+                    self.timestamps = np.asarray(
+                        [wp.get('timestamp', 'unknown') for wp in waypoints]
+                    )
+                else:
+                    # reshape(0, -1) is ambiguous on an empty array;
+                    # build the empty arrays directly so the
+                    # no-waypoints check below reports it cleanly
+                    self.positions = np.empty((0, 0), dtype=np.int16)
+                    self.ids = np.empty(0, dtype=np.int64)
+                    self.timestamps = np.empty(0, dtype=object)
+                self._save_cache(filename, stat)
+
+            # Intern the joint names so all references collapse to one
+            # string object each and downstream == checks are pointer
+            # comparisons
+            names = self.metadata.get('joint_names')
+            if names:
+                self.metadata['joint_names'] = [sys.intern(n) for n in names]
+
+            if cache_key not in _WP_CACHE:
+                _WP_CACHE[cache_key] = (self.metadata, self.positions,
+                                        self.ids, self.timestamps)
+                while len(_WP_CACHE) > _WP_CACHE_MAX:
+                    _WP_CACHE.popitem(last=False)
+
+            if len(self.positions) == 0:
                 print(f"✗ No waypoints found in file: {filename}")
                 return False
-            
+
             # Display file info
-            metadata = self.waypoint_data.get('metadata', {})
             print(f"✓ Loaded waypoint file: {filename}")
-            print(f"  Robot type: {metadata.get('robot_type', 'unknown')}")
-            print(f"  Created: {metadata.get('created_at', 'unknown')}")
-            print(f"  Total waypoints: {len(self.waypoints)}")
-            print(f"  Joint names: {', '.join(metadata.get('joint_names', []))}")
+            print(f"  Robot type: {self.metadata.get('robot_type', 'unknown')}")
+            print(f"  Created: {self.metadata.get('created_at', 'unknown')}")
+            print(f"  Total waypoints: {len(self.positions)}")
+            print(f"  Joint names: {', '.join(self.metadata.get('joint_names', []))}")
             
             return True
             
-        except json.JSONDecodeError as e:
-            print(f"✗ Invalid JSON format in {filename}: {e}")
+        except ValueError as e:
+            print(f"✗ Invalid waypoint file {filename}: {e}")
             return False
         except Exception as e:
             print(f"✗ Failed to load waypoints from {filename}: {e}")
@@ -119,20 +371,18 @@ class WaypointPlayer:
             print("✗ Robot not calibrated")
             return False
         
-        if not self.waypoints:
+        if self.positions is None or len(self.positions) == 0:
             print("✗ No waypoints loaded")
             return False
-        
+
         # Check if number of joints matches
         expected_joints = len(self.robot.calibration)
-        
-        for i, waypoint in enumerate(self.waypoints):
-            positions = waypoint.get('positions', [])
-            if len(positions) != expected_joints:
-                print(f"✗ Waypoint {i+1} has {len(positions)} positions, expected {expected_joints}")
-                return False
-        
-        print(f"✓ All {len(self.waypoints)} waypoints validated")
+
+        if self.positions.shape[1] != expected_joints:
+            print(f"✗ Waypoints have {self.positions.shape[1]} positions, expected {expected_joints}")
+            return False
+
+        print(f"✓ All {len(self.positions)} waypoints validated")
         return True
     
     def preview_waypoints(self, start_idx: int = 0, end_idx: Optional[int] = None, reverse: bool = False):
@@ -144,34 +394,122 @@ class WaypointPlayer:
             end_idx: Ending waypoint index (0-based, inclusive)
             reverse: Whether to reverse the order
         """
-        if not self.waypoints:
+        if self.positions is None or len(self.positions) == 0:
             print("No waypoints to preview")
             return
-        
+
         if end_idx is None:
-            end_idx = len(self.waypoints) - 1
-        
-        # Get waypoints to play
-        waypoints_to_play = self.waypoints[start_idx:end_idx+1]
+            end_idx = len(self.positions) - 1
+
+        # Zero-copy views of the waypoints to play
+        positions = self.positions[start_idx:end_idx+1]
+        ids = self.ids[start_idx:end_idx+1]
+        timestamps = self.timestamps[start_idx:end_idx+1]
         if reverse:
-            waypoints_to_play = waypoints_to_play[::-1]
-        
-        print(f"\nWaypoint Preview ({len(waypoints_to_play)} waypoints):")
-        print("-" * 80)
-        
-        for i, waypoint in enumerate(waypoints_to_play):
-            original_id = waypoint.get('id', i+1)
-            positions = waypoint.get('positions', [])
-            timestamp = waypoint.get('timestamp', 'unknown')
-            
-            print(f"Step {i+1:2d} (Original ID {original_id}): {positions}")
-            if len(waypoints_to_play) <= 10:  # Only show timestamps for small lists
-                print(f"         Recorded: {timestamp}")
+            positions = positions[::-1]
+            ids = ids[::-1]
+            timestamps = timestamps[::-1]
+
+        # Build the preview as one buffer and write it with a single
+        # syscall instead of one print per waypoint
+        lines = [f"\nWaypoint Preview ({len(positions)} waypoints):", "-" * 80]
+        show_timestamps = len(positions) <= 10  # Only for small lists
+
+        for i in range(len(positions)):
+            lines.append(f"Step {i+1:2d} (Original ID {ids[i]}): {positions[i].tolist()}")
+            if show_timestamps:
+                lines.append(f"         Recorded: {timestamps[i]}")
+
+        sys.stdout.write('\n'.join(lines) + '\n')
     
-    def playback_waypoints(self, speed: int = 200, acceleration: int = 100, 
+    def _densify(self, positions: np.ndarray, step: int) -> np.ndarray:
+        """
+        Interpolate equidistant intermediate commands between waypoints.
+
+        Each segment is sampled with np.linspace so consecutive commands
+        are roughly `step` position units apart on the fastest-moving
+        joint, turning the sparse waypoint list into one dense
+        (M, n_joints) int16 command stream.
+
+        Args:
+            positions: (N, n_joints) waypoint position matrix
+            step: Approximate position-unit spacing between commands
+
+        Returns:
+            np.ndarray: Dense (M, n_joints) int16 command matrix
+        """
+        if len(positions) < 2:
+            return positions
+
+        segments = []
+        wide = positions.astype(np.int32)
+        for p0, p1 in zip(wide[:-1], wide[1:]):
+            dist = int(np.max(np.abs(p1 - p0)))
+            n_steps = max(2, dist // max(1, step) + 1)
+            # Drop the segment end point; it is the next segment's start
+            segments.append(np.linspace(p0, p1, n_steps, dtype=np.int16)[:-1])
+        segments.append(positions[-1:])
+
+        return np.concatenate(segments)
+
+    def _stream_chunks(self, command_stream: np.ndarray, speed: int,
+                       acceleration: int, wait_time: float) -> bool:
+        """
+        Stream commands to the robot through a producer/consumer queue.
+
+        A producer thread slices the command matrix into small zero-copy
+        views and keeps a bounded queue filled, so the next batch is
+        already prepared in Python while the consumer is busy writing to
+        the serial bus. A None sentinel marks the end of the stream.
+
+        Args:
+            command_stream: (M, n_joints) position command matrix
+            speed: Movement speed (0-1000)
+            acceleration: Movement acceleration (0-255)
+            wait_time: Time to wait after each command (seconds)
+
+        Returns:
+            bool: True if every command was sent successfully
+        """
+        command_queue = queue.Queue(maxsize=4)
+
+        def produce():
+            for start in range(0, len(command_stream), PLAYBACK_CHUNK):
+                command_queue.put(command_stream[start:start + PLAYBACK_CHUNK])
+            command_queue.put(None)  # Sentinel: stream complete
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        # Deadline-based pacing: each command is scheduled at
+        # t0 + i*wait_time so sleep overshoot never accumulates into
+        # drift across the stream
+        success = True
+        sent = 0
+        t0 = time.perf_counter()
+        while True:
+            chunk = command_queue.get()
+            if chunk is None:
+                break
+            if not success:
+                continue  # Drain remaining chunks after a failure
+
+            for positions in chunk:
+                if not self.robot.move_to_position(positions, speed, acceleration):
+                    success = False
+                    break
+                sent += 1
+                delay = t0 + sent * wait_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+        producer.join()
+        return success
+
+    def playback_waypoints(self, speed: int = 200, acceleration: int = 100,
                           wait_time: float = 2.0, loop_count: int = 1,
                           start_waypoint: int = 1, end_waypoint: Optional[int] = None,
-                          reverse: bool = False) -> bool:
+                          reverse: bool = False, interpolate: bool = False) -> bool:
         """
         Play back the loaded waypoints.
         
@@ -183,7 +521,8 @@ class WaypointPlayer:
             start_waypoint: Starting waypoint number (1-based)
             end_waypoint: Ending waypoint number (1-based, inclusive)
             reverse: Play waypoints in reverse order
-            
+            interpolate: Densify waypoints with equidistant interpolation
+
         Returns:
             bool: True if playback completed successfully, False otherwise
         """
@@ -192,26 +531,26 @@ class WaypointPlayer:
         
         # Convert to 0-based indices
         start_idx = start_waypoint - 1
-        end_idx = (end_waypoint - 1) if end_waypoint else len(self.waypoints) - 1
-        
+        end_idx = (end_waypoint - 1) if end_waypoint else len(self.positions) - 1
+
         # Validate indices
-        if start_idx < 0 or start_idx >= len(self.waypoints):
+        if start_idx < 0 or start_idx >= len(self.positions):
             print(f"✗ Invalid start waypoint: {start_waypoint}")
             return False
-        
-        if end_idx < 0 or end_idx >= len(self.waypoints) or end_idx < start_idx:
+
+        if end_idx < 0 or end_idx >= len(self.positions) or end_idx < start_idx:
             print(f"✗ Invalid end waypoint: {end_waypoint}")
             return False
-        
-        # Get waypoints to play
-        waypoints_to_play = self.waypoints[start_idx:end_idx+1]
+
+        # Zero-copy view of the positions to play
+        positions_to_play = self.positions[start_idx:end_idx+1]
         if reverse:
-            waypoints_to_play = waypoints_to_play[::-1]
-        
+            positions_to_play = positions_to_play[::-1]
+
         print(f"\n" + "="*60)
         print("WAYPOINT PLAYBACK")
         print("="*60)
-        print(f"Waypoints: {len(waypoints_to_play)} (from {start_waypoint} to {end_waypoint or len(self.waypoints)})")
+        print(f"Waypoints: {len(positions_to_play)} (from {start_waypoint} to {end_waypoint or len(self.positions)})")
         print(f"Speed: {speed}, Acceleration: {acceleration}, Wait time: {wait_time}s")
         print(f"Loop count: {'infinite' if loop_count == 0 else loop_count}")
         print(f"Reverse order: {reverse}")
@@ -225,6 +564,17 @@ class WaypointPlayer:
             print("Playback cancelled")
             return False
         
+        # Build the command stream once; looped playback reuses the same
+        # array and the streaming path slices zero-copy views from it
+        effective_wait = wait_time
+        if interpolate and len(positions_to_play) > 1:
+            command_stream = self._densify(positions_to_play, step=max(1, speed // 10))
+            # Spread the per-waypoint wait over the dense command stream
+            effective_wait = wait_time * (len(positions_to_play) - 1) / max(1, len(command_stream) - 1)
+            print(f"Interpolated {len(positions_to_play)} waypoints into {len(command_stream)} commands")
+        else:
+            command_stream = positions_to_play
+
         # Execute playback
         try:
             current_loop = 0
@@ -237,11 +587,9 @@ class WaypointPlayer:
                     print(f"\n--- Loop {current_loop}/{loop_count} ---")
                 
                 # Execute waypoints
-                success = self.robot.execute_waypoints(
-                    [wp['positions'] for wp in waypoints_to_play],
-                    speed=speed,
-                    acceleration=acceleration,
-                    wait_time=wait_time
+                print(f"\n--- Streaming {len(command_stream)} commands ---")
+                success = self._stream_chunks(
+                    command_stream, speed, acceleration, effective_wait
                 )
                 
                 if not success:
@@ -282,6 +630,7 @@ Examples:
     parser.add_argument('--start-waypoint', type=int, default=1, help='Start from waypoint N (default: 1)')
     parser.add_argument('--end-waypoint', type=int, help='End at waypoint N (default: last)')
     parser.add_argument('--reverse', action='store_true', help='Play waypoints in reverse order')
+    parser.add_argument('--interpolate', action='store_true', help='Densify waypoints with equidistant interpolation for smoother motion')
     parser.add_argument('--list', action='store_true', help='List available waypoint files and exit')
     
     return parser.parse_args()
@@ -297,15 +646,14 @@ def main():
     # Handle --list option
     if args.list:
         player = WaypointPlayer(None)  # Don't need robot connection for listing
-        waypoint_files = player.list_waypoint_files()
-        
-        if waypoint_files:
-            print(f"\nAvailable waypoint files ({len(waypoint_files)}):")
+        entries = sorted(player._iter_waypoint_files(), key=lambda e: e.name)
+
+        if entries:
+            print(f"\nAvailable waypoint files ({len(entries)}):")
             print("-" * 50)
-            for i, filename in enumerate(waypoint_files, 1):
-                file_size = os.path.getsize(filename)
-                mod_time = time.ctime(os.path.getmtime(filename))
-                print(f"{i:2d}. {filename} ({file_size} bytes, {mod_time})")
+            for i, entry in enumerate(entries, 1):
+                st = entry.stat()  # Cached by scandir, one stat per file
+                print(f"{i:2d}. {entry.name} ({st.st_size} bytes, {time.ctime(st.st_mtime)})")
         else:
             print("\nNo waypoint files found in current directory")
             print("Waypoint files should match patterns: waypoints_*.json or *waypoint*.json")
@@ -318,10 +666,10 @@ def main():
     if not waypoint_file:
         # Try to find the most recent waypoint file
         player = WaypointPlayer(None)
-        waypoint_files = player.list_waypoint_files()
-        
-        if waypoint_files:
-            waypoint_file = waypoint_files[-1]  # Most recent
+        entries = list(player._iter_waypoint_files())
+
+        if entries:
+            waypoint_file = max(entries, key=lambda e: e.stat().st_mtime).name
             print(f"No waypoint file specified. Using most recent: {waypoint_file}")
         else:
             print("✗ No waypoint file specified and no waypoint files found")
@@ -329,7 +677,9 @@ def main():
             print("Or use --list to see available files")
             return
     
-    # Initialize robot and player
+    # Initialize robot and player (import deferred past the list-only paths)
+    from robot import Robot
+
     robot = Robot()
     player = WaypointPlayer(robot)
     
@@ -359,7 +709,8 @@ def main():
             loop_count=args.loop,
             start_waypoint=args.start_waypoint,
             end_waypoint=args.end_waypoint,
-            reverse=args.reverse
+            reverse=args.reverse,
+            interpolate=args.interpolate
         )
         
         if success:
@@ -17,11 +17,23 @@ import os
 import time
 import json
 import sys
+import array
+
+try:
+    import orjson  # Fast C/Rust JSON serializer, optional
+except ImportError:
+    orjson = None
+
 from datetime import datetime
 from typing import List, Dict, Any
 
+import numpy as np
+
 from robot import Robot
 
+# Positions within this delta of the last display are treated as unchanged
+REDISPLAY_DELTA = 3
+
 class WaypointRecorder:
     """
     Records robot waypoints by capturing current positions when user presses enter.
@@ -35,9 +47,41 @@ class WaypointRecorder:
             robot: Connected Robot instance
         """
         self.robot = robot
-        self.waypoints = []
         self.waypoint_file = None
+
+        # Struct-of-arrays waypoint buffer: a flat int16 position array
+        # plus parallel id/timestamp lists (joint names live once in the
+        # session metadata, not per waypoint)
+        self._positions = array.array('h')
+        self._ids = []
+        self._timestamps = []
+        self._waypoint_fp = None     # Open JSONL log, one line per waypoint
+        self._last_displayed = None  # Last printed positions, to skip redraws
+
+        # Cache the servo ordering and joint names once instead of
+        # re-sorting the calibration dict on every prompt
+        if robot is not None and robot.calibration:
+            self._sorted_ids = tuple(sorted(robot.calibration.keys()))
+            self._joint_names = tuple(robot.calibration[i].name
+                                      for i in self._sorted_ids)
+        else:
+            self._sorted_ids = ()
+            self._joint_names = ()
         
+    @property
+    def waypoint_count(self) -> int:
+        """Number of waypoints recorded so far."""
+        return len(self._ids)
+
+    def _waypoint_dict(self, index: int) -> Dict[str, Any]:
+        """Materialize one waypoint dict from the parallel arrays."""
+        n_joints = len(self._sorted_ids)
+        return {
+            'id': self._ids[index],
+            'timestamp': self._timestamps[index],
+            'positions': self._positions[index * n_joints:(index + 1) * n_joints].tolist()
+        }
+
     def get_waypoint_filename(self) -> str:
         """
         Get waypoint filename from user input or generate default.
@@ -55,16 +99,18 @@ class WaypointRecorder:
             choice = input("Choose option (1/2) [2]: ").strip()
             
             if choice == "1":
-                filename = input("Enter waypoint filename (without .json): ").strip()
+                filename = input("Enter waypoint filename (without .jsonl): ").strip()
                 if not filename:
                     filename = f"waypoints_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             else:
                 filename = f"waypoints_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        
-        # Ensure .json extension
-        if not filename.endswith('.json'):
-            filename += '.json'
-            
+
+        # Ensure .jsonl extension (one JSON line per waypoint)
+        if filename.endswith('.json'):
+            filename += 'l'
+        elif not filename.endswith('.jsonl'):
+            filename += '.jsonl'
+
         return filename
     
     def display_current_position(self) -> List[int]:
@@ -77,27 +123,37 @@ class WaypointRecorder:
         if not self.robot.has_calibration():
             print("✗ No calibration data available")
             return []
-        
-        positions = []
-        print("\nCurrent Robot Position:")
-        print("-" * 50)
-        
-        for servo_id in sorted(self.robot.calibration.keys()):
+
+        # One batched bus transaction for all servos
+        position_map = self.robot._sync_read_positions()
+
+        raw_positions = [position_map.get(servo_id) for servo_id in self._sorted_ids]
+        positions = [p if p is not None else 0 for p in raw_positions]
+
+        # One vectorized op instead of a per-servo divide/multiply
+        pcts = (np.asarray(positions, np.float32) - self.robot._cal_min) * self.robot._cal_inv100
+
+        lines = []
+        for i, servo_id in enumerate(self._sorted_ids):
             cal = self.robot.calibration[servo_id]
-            status = self.robot.get_servo_status(servo_id)
-            
-            if status['position'] is not None:
-                position = status['position']
-                positions.append(position)
-                
-                # Calculate percentage of range
-                range_pct = ((position - cal['range_min']) / cal['range_size']) * 100
-                
-                print(f"{cal['name']:12} (ID {servo_id}): {position:>5} ({range_pct:>5.1f}% of range)")
+            if raw_positions[i] is not None:
+                lines.append(f"{cal.name:12} (ID {servo_id}): {positions[i]:>5} ({pcts[i]:>5.1f}% of range)")
             else:
-                print(f"{cal['name']:12} (ID {servo_id}): ERROR - {status.get('error', 'Unknown')}")
-                positions.append(0)  # Default value for failed reads
-        
+                lines.append(f"{cal.name:12} (ID {servo_id}): ERROR - read failed")
+
+        # Skip redrawing when the robot hasn't meaningfully moved
+        if (self._last_displayed is not None
+                and len(self._last_displayed) == len(positions)
+                and all(abs(a - b) <= REDISPLAY_DELTA
+                        for a, b in zip(positions, self._last_displayed))):
+            return positions
+
+        print("\nCurrent Robot Position:")
+        print("-" * 50)
+        for line in lines:
+            print(line)
+
+        self._last_displayed = positions.copy()
         return positions
     
     def record_waypoint(self) -> bool:
@@ -117,7 +173,11 @@ class WaypointRecorder:
         
         # Get filename
         self.waypoint_file = self.get_waypoint_filename()
-        
+
+        # Line-buffered JSONL log: every waypoint hits the disk as soon
+        # as it is recorded, so an interrupted session loses nothing
+        self._waypoint_fp = open(self.waypoint_file, 'w', buffering=1)
+
         print("\n" + "="*60)
         print("WAYPOINT RECORDING MODE")
         print("="*60)
@@ -131,22 +191,12 @@ class WaypointRecorder:
         print("5. Type 'show' and press ENTER to show all recorded waypoints")
         print()
         
-        # Disable torque for manual positioning
+        # Disable torque for manual positioning (one sync-write packet)
         print("Disabling torque on all servos for manual positioning...")
-        from robot import DEFAULT_SERVOS, ADDR_SCS_TORQUE_ENABLE, COMM_SUCCESS
-        
-        for servo_name, servo_config in DEFAULT_SERVOS.items():
-            servo_id = servo_config["id"]
-            try:
-                result, error = self.robot.packet_handler.write1ByteTxRx(
-                    self.robot.port_handler, servo_id, ADDR_SCS_TORQUE_ENABLE, 0
-                )
-                if result == COMM_SUCCESS and error == 0:
-                    print(f"✓ {servo_name} torque disabled")
-                else:
-                    print(f"⚠ {servo_name} may not be responding")
-            except:
-                print(f"⚠ {servo_name} may not be responding")
+        if self.robot.set_torque_all(False):
+            print("✓ All servos torque disabled")
+        else:
+            print("⚠ Some servos may not be responding")
         
         print("\n" + "="*60)
         print("READY TO RECORD WAYPOINTS")
@@ -162,7 +212,7 @@ class WaypointRecorder:
                 print("✗ Could not read robot positions")
                 return False
             
-            print(f"\nWaypoints recorded: {len(self.waypoints)}")
+            print(f"\nWaypoints recorded: {self.waypoint_count}")
             print("Commands: ENTER=record, 'exit'=finish, 'delete'=remove last, 'show'=list all")
             
             # Get user input
@@ -172,9 +222,14 @@ class WaypointRecorder:
                 print(f"\nFinishing recording session...")
                 break
             elif user_input == 'delete':
-                if self.waypoints:
-                    deleted = self.waypoints.pop()
-                    print(f"✓ Deleted waypoint {len(self.waypoints) + 1}: {deleted['positions']}")
+                if self._ids:
+                    n_joints = len(self._sorted_ids)
+                    deleted_positions = self._positions[-n_joints:].tolist()
+                    del self._positions[-n_joints:]
+                    self._ids.pop()
+                    self._timestamps.pop()
+                    self._rewrite_log()
+                    print(f"✓ Deleted waypoint {len(self._ids) + 1}: {deleted_positions}")
                 else:
                     print("⚠ No waypoints to delete")
                 continue
@@ -184,17 +239,11 @@ class WaypointRecorder:
             elif user_input == '':
                 # Record waypoint
                 waypoint_count += 1
-                timestamp = datetime.now().isoformat()
-                
-                waypoint = {
-                    'id': waypoint_count,
-                    'timestamp': timestamp,
-                    'positions': current_positions.copy(),
-                    'joint_names': [self.robot.calibration[servo_id]['name'] 
-                                  for servo_id in sorted(self.robot.calibration.keys())]
-                }
-                
-                self.waypoints.append(waypoint)
+                self._ids.append(waypoint_count)
+                self._timestamps.append(datetime.now().isoformat())
+                self._positions.extend(current_positions)
+
+                self._append_waypoint(self._waypoint_dict(len(self._ids) - 1))
                 print(f"✓ Recorded waypoint {waypoint_count}: {current_positions}")
             else:
                 print("⚠ Unknown command. Use ENTER, 'exit', 'delete', or 'show'")
@@ -204,51 +253,78 @@ class WaypointRecorder:
     
     def show_waypoints(self):
         """Display all recorded waypoints."""
-        if not self.waypoints:
+        if not self._ids:
             print("No waypoints recorded yet.")
             return
-        
-        print(f"\nRecorded Waypoints ({len(self.waypoints)} total):")
-        print("-" * 80)
-        
-        for i, waypoint in enumerate(self.waypoints):
-            print(f"Waypoint {waypoint['id']:2d}: {waypoint['positions']}")
-            if i < len(self.waypoints) - 1:  # Don't print separator after last waypoint
-                print("             " + " " * len(str(waypoint['positions'])))
+
+        # One buffered write instead of one print per waypoint
+        lines = [f"\nRecorded Waypoints ({self.waypoint_count} total):", "-" * 80]
+        for i in range(self.waypoint_count):
+            waypoint = self._waypoint_dict(i)
+            lines.append(f"Waypoint {waypoint['id']:2d}: {waypoint['positions']}")
+
+        sys.stdout.write('\n'.join(lines) + '\n')
     
+    def _append_waypoint(self, waypoint: Dict[str, Any]):
+        """Append one waypoint as a compact JSON line to the open log."""
+        if orjson is not None:
+            self._waypoint_fp.write(orjson.dumps(waypoint).decode() + '\n')
+        else:
+            self._waypoint_fp.write(json.dumps(waypoint) + '\n')
+
+    def _rewrite_log(self):
+        """Rewrite the JSONL log from scratch after a deletion."""
+        self._waypoint_fp.close()
+        self._waypoint_fp = open(self.waypoint_file, 'w', buffering=1)
+        for i in range(self.waypoint_count):
+            self._append_waypoint(self._waypoint_dict(i))
+
     def save_waypoints(self) -> bool:
         """
-        Save recorded waypoints to JSON file.
-        
+        Finalize the JSONL log and write the metadata sidecar.
+
+        The waypoints themselves are already on disk (one line each,
+        flushed at record time); this just closes the log and writes
+        <file>.meta.json with the session metadata.
+
         Returns:
             bool: True if saved successfully, False otherwise
         """
-        if not self.waypoints:
+        if self._waypoint_fp is not None:
+            self._waypoint_fp.close()
+            self._waypoint_fp = None
+
+        if not self._ids:
+            # The log was created when recording started; don't leave a
+            # zero-byte file behind for playback to trip over
+            try:
+                os.remove(self.waypoint_file)
+            except OSError:
+                pass
             print("⚠ No waypoints to save")
             return True
-        
+
         try:
-            # Create waypoint data structure
-            waypoint_data = {
-                'metadata': {
-                    'robot_type': 'so100_follower',
-                    'created_at': datetime.now().isoformat(),
-                    'total_waypoints': len(self.waypoints),
-                    'joint_names': [self.robot.calibration[servo_id]['name'] 
-                                  for servo_id in sorted(self.robot.calibration.keys())],
-                    'calibration_file': 'robot_calibration.json'
-                },
-                'waypoints': self.waypoints
+            metadata = {
+                'robot_type': 'so100_follower',
+                'created_at': datetime.now().isoformat(),
+                'total_waypoints': self.waypoint_count,
+                'joint_names': list(self._joint_names),
+                'calibration_file': 'robot_calibration.json'
             }
-            
-            # Save to file
-            with open(self.waypoint_file, 'w') as f:
-                json.dump(waypoint_data, f, indent=4)
-            
-            print(f"\n✓ Saved {len(self.waypoints)} waypoints to {self.waypoint_file}")
+
+            meta_file = self.waypoint_file + '.meta.json'
+            if orjson is not None:
+                with open(meta_file, 'wb') as f:
+                    f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+            else:
+                with open(meta_file, 'w') as f:
+                    json.dump(metadata, f, indent=4)
+
+            print(f"\n✓ Saved {self.waypoint_count} waypoints to {self.waypoint_file}")
             print(f"File size: {os.path.getsize(self.waypoint_file)} bytes")
             return True
-            
+
         except Exception as e:
             print(f"✗ Failed to save waypoints: {e}")
             return False
@@ -285,7 +361,7 @@ def main():
             
     except KeyboardInterrupt:
         print("\n\nRecording interrupted by user")
-        if recorder.waypoints:
+        if recorder.waypoint_count:
             save_choice = input("Save recorded waypoints? (y/N): ").strip().lower()
             if save_choice == 'y':
                 if not recorder.waypoint_file:
@@ -28,11 +28,40 @@ Usage:
 """
 
 import os
+import sys
 import time
 import json
 import math
+import queue
+import struct
+import logging
+import threading
+from enum import IntEnum
 from typing import List, Dict, Tuple, Optional, Any
 
+import numpy as np
+
+try:
+    import orjson  # Fast C/Rust JSON parser, optional
+except ImportError:
+    orjson = None
+
+try:
+    import numba  # Optional JIT for pure-numeric helpers
+except ImportError:
+    numba = None
+
+try:
+    from scipy.interpolate import CubicSpline  # Optional spline trajectories
+except ImportError:
+    CubicSpline = None
+
+try:
+    # Optional jerk-limited online trajectory generation
+    from ruckig import Ruckig, InputParameter, OutputParameter, Result
+except ImportError:
+    Ruckig = None
+
 if os.name == 'nt':
     import msvcrt
     def getch():
@@ -52,14 +81,26 @@ else:
 from scservo_sdk import *
 
 # Control table addresses
-ADDR_SCS_TORQUE_ENABLE     = 40
-ADDR_SCS_GOAL_ACC          = 41
-ADDR_SCS_GOAL_POSITION     = 42
-ADDR_SCS_GOAL_SPEED        = 46
-ADDR_SCS_PRESENT_POSITION  = 56
-ADDR_SCS_PRESENT_LOAD      = 60
-ADDR_SCS_PRESENT_VOLTAGE   = 62
-ADDR_SCS_PRESENT_TEMPERATURE = 63
+class Reg(IntEnum):
+    """SCS servo control-table register addresses."""
+    TORQUE_ENABLE       = 40
+    GOAL_ACC            = 41
+    GOAL_POSITION       = 42
+    GOAL_SPEED          = 46
+    PRESENT_POSITION    = 56
+    PRESENT_LOAD        = 60
+    PRESENT_VOLTAGE     = 62
+    PRESENT_TEMPERATURE = 63
+
+# Backwards-compatible module-level aliases (plain ints)
+ADDR_SCS_TORQUE_ENABLE     = Reg.TORQUE_ENABLE.value
+ADDR_SCS_GOAL_ACC          = Reg.GOAL_ACC.value
+ADDR_SCS_GOAL_POSITION     = Reg.GOAL_POSITION.value
+ADDR_SCS_GOAL_SPEED        = Reg.GOAL_SPEED.value
+ADDR_SCS_PRESENT_POSITION  = Reg.PRESENT_POSITION.value
+ADDR_SCS_PRESENT_LOAD      = Reg.PRESENT_LOAD.value
+ADDR_SCS_PRESENT_VOLTAGE   = Reg.PRESENT_VOLTAGE.value
+ADDR_SCS_PRESENT_TEMPERATURE = Reg.PRESENT_TEMPERATURE.value
 
 # Communication settings
 BAUDRATE                = 1000000
@@ -76,20 +117,158 @@ DEFAULT_SERVOS = {
     "gripper": {"id": 6, "drive_mode": 0}
 }
 
+# Hot-path diagnostics go through a lazy logger (silent unless the app
+# enables DEBUG), so waypoint streaming produces zero stdout I/O
+log = logging.getLogger(__name__)
+
 # Calibration settings
 CALIBRATION_FILE = "robot_calibration.json"
 CALIBRATION_SPEED = 500          # Slow speed for calibration
 CALIBRATION_ACC = 100            # Low acceleration for calibration
 OVERLOAD_THRESHOLD = 3          # Number of consecutive overload errors to detect limit
 POSITION_STEP = 10              # Step size during calibration
+SWEEP_STEPS = (200, 25, 5)      # Coarse-to-fine probe steps for limit detection
+
+# Groups of servo IDs that are mechanically independent of each other and
+# may therefore be limit-swept concurrently (interleaved on the one bus)
+# during auto-calibration, e.g. ({1, 2, 3}, {4, 5, 6}). The conservative
+# default is empty: every joint calibrates sequentially.
+INDEPENDENT_GROUPS: Tuple = ()
 MAX_POSITION = 4095             # Maximum possible position value
 MIN_POSITION = -4095            # Minimum possible position value (can be negative)
 
+def _plan_probe_positions(start: int, limit: int, direction: int,
+                          step: int) -> np.ndarray:
+    """
+    Plan the probe positions for one limit-sweep pass.
+
+    Steps from `start` toward `limit` in increments of `step`, clamping
+    the final probe to the bound. Pure integer math, so the whole plan
+    is computed up front (and JIT-compiled when numba is installed)
+    while the servo I/O loop just consumes it.
+
+    Args:
+        start: Position the sweep starts from
+        limit: Absolute bound to sweep toward
+        direction: +1 to sweep above start, -1 to sweep below
+        step: Probe step size
+
+    Returns:
+        np.ndarray: int32 array of positions to probe, in order
+    """
+    dist = (limit - start) * direction
+    if dist < 0:
+        dist = 0
+    n = (dist + step - 1) // step
+    out = np.empty(n, np.int32)
+    pos = start
+    for i in range(n):
+        pos += direction * step
+        if (limit - pos) * direction < 0:
+            pos = limit
+        out[i] = pos
+    return out
+
+
+if numba is not None:
+    _plan_probe_positions = numba.njit(cache=True)(_plan_probe_positions)
+
+
+def _clamp_block(samples: np.ndarray, rmin: np.ndarray,
+                 rmax: np.ndarray) -> np.ndarray:
+    """
+    Clamp a dense (W, N) sample block to per-joint limits, in place.
+
+    Trajectory streaming clamps the whole sample matrix once up front
+    with this kernel (JIT-compiled when numba is installed), so the
+    per-tick send path does no range checking at all.
+
+    Args:
+        samples: (W, N) int32 sample matrix, modified in place
+        rmin: Per-joint minimum positions, length N
+        rmax: Per-joint maximum positions, length N
+
+    Returns:
+        np.ndarray: The clamped sample matrix
+    """
+    for i in range(samples.shape[0]):
+        for j in range(samples.shape[1]):
+            v = samples[i, j]
+            if v < rmin[j]:
+                samples[i, j] = rmin[j]
+            elif v > rmax[j]:
+                samples[i, j] = rmax[j]
+    return samples
+
+
+if numba is not None:
+    _clamp_block = numba.njit(cache=True)(_clamp_block)
+
+
+def _min_jerk_profile(start: int, end: int, n: int) -> np.ndarray:
+    """
+    Sample a minimum-jerk position profile from start to end.
+
+    Uses the quintic 10t³ - 15t⁴ + 6t⁵ time scaling, which has zero
+    velocity and acceleration at both endpoints, so waypoints derived
+    from it command smooth ramps instead of piecewise-constant velocity
+    jumps.
+
+    Args:
+        start: Start position
+        end: End position
+        n: Number of samples, endpoints included
+
+    Returns:
+        np.ndarray: int32 array of n positions from start to end
+    """
+    t = np.linspace(0.0, 1.0, n)
+    s = t * t * t * (10.0 - 15.0 * t + 6.0 * t * t)
+    return np.rint(start + (end - start) * s).astype(np.int32)
+
+
+class _ServoCal:
+    """
+    Per-servo calibration record.
+
+    A slotted class instead of a dict: attribute access in the motion
+    hot loops is an offset load rather than a string-hash lookup, and
+    each entry is roughly half the size.
+    """
+
+    __slots__ = ('name', 'id', 'drive_mode', 'homing_offset',
+                 'range_min', 'range_max', 'range_size', 'pct_scale')
+
+    def __init__(self, name, id, drive_mode, homing_offset,
+                 range_min, range_max):
+        self.name = name
+        self.id = id
+        self.drive_mode = drive_mode
+        self.homing_offset = homing_offset
+        self.range_min = range_min
+        self.range_max = range_max
+        self.range_size = range_max - range_min
+        # Position → percent-of-range is a single multiply in hot paths
+        self.pct_scale = 100.0 / self.range_size if self.range_size else 0.0
+
+
 class Robot:
     """
     SO-100 Follower Robot Controller with Auto-Calibration and Waypoint Navigation
     """
-    
+
+    # Register addresses bound as plain-int class attributes: attribute
+    # lookups on self inline-cache under CPython 3.11+, unlike the
+    # LOAD_GLOBAL every module-level constant costs in hot methods
+    TORQUE_ENABLE       = Reg.TORQUE_ENABLE.value
+    GOAL_ACC            = Reg.GOAL_ACC.value
+    GOAL_POSITION       = Reg.GOAL_POSITION.value
+    GOAL_SPEED          = Reg.GOAL_SPEED.value
+    PRESENT_POSITION    = Reg.PRESENT_POSITION.value
+    PRESENT_LOAD        = Reg.PRESENT_LOAD.value
+    PRESENT_VOLTAGE     = Reg.PRESENT_VOLTAGE.value
+    PRESENT_TEMPERATURE = Reg.PRESENT_TEMPERATURE.value
+
     def __init__(self, device_name: str = DEVICENAME, baudrate: int = BAUDRATE):
         """
         Initialize the robot controller.
@@ -102,13 +281,91 @@ class Robot:
         self.baudrate = baudrate
         self.calibration = {}
         self.servo_names = {}  # Map ID to name
+        self._has_cal = False  # Cached has_calibration answer
         self.port_handler = None
         self.packet_handler = None
         self.is_connected = False
+        self._group_sync_read_pos = None
+        self._group_sync_read_status = None
+        self._gsw_pos = None      # GroupSyncWrite handle for goal position
+        self._gsw_speed = None    # GroupSyncWrite handle for goal speed
+        self._gsw_acc = None      # GroupSyncWrite handle for goal acceleration
+        self._gsw_motion = None   # GroupSyncWrite handle for acc+pos+speed
+        self._last_goal = {}      # Last goal position sent per servo
+        self._last_speed = None   # Last speed applied to all servos
+        self._last_acc = None     # Last acceleration applied to all servos
+        self._torque_on = False   # True when torque is known-enabled everywhere
+        self._cal_min = None      # Per-servo range_min, float32, sorted ID order
+        self._cal_inv100 = None   # Per-servo 100/range_size, float32
+        self._id_order = ()       # Servo IDs in sorted order
+        self._cal_list = ()       # Calibration entries in the same order
+        self._range_min_arr = None  # Per-servo range_min, int32
+        self._range_max_arr = None  # Per-servo range_max, int32
+        self._range_size_arr = None  # Per-servo range_size, int32
+        self._center_positions = []  # Per-servo range centers, sorted ID order
+        self._status_headers = ()   # Preformatted per-servo status headers
         
         # Load existing calibration if available
         self.load_calibration()
     
+    def _enable_low_latency(self):
+        """
+        Put the USB-serial port into low-latency mode.
+
+        FTDI-style adapters buffer received bytes for up to 16ms by
+        default, which dominates round-trip time at 1 Mbaud. Setting
+        ASYNC_LOW_LATENCY drops the kernel latency timer to 1ms. All
+        failures are non-fatal (CDC-ACM devices have no latency timer
+        at all); the port still works, just with the default timing.
+        """
+        if os.name == 'nt':
+            return
+
+        try:
+            import array
+            import fcntl
+
+            TIOCGSERIAL = 0x541E
+            TIOCSSERIAL = 0x541F
+            ASYNC_LOW_LATENCY = 0x2000
+
+            ser = getattr(self.port_handler, 'ser', None)
+            if ser is None:
+                return
+            fd = ser.fileno()
+
+            buf = array.array('i', [0] * 64)
+            fcntl.ioctl(fd, TIOCGSERIAL, buf)
+            buf[4] |= ASYNC_LOW_LATENCY  # serial_struct.flags
+            fcntl.ioctl(fd, TIOCSSERIAL, buf)
+            print("✓ Serial port set to low-latency mode")
+        except Exception:
+            # ioctl unsupported on this adapter; try setserial instead
+            try:
+                import subprocess
+                subprocess.run(
+                    ['setserial', self.device_name, 'low_latency'],
+                    capture_output=True, timeout=2
+                )
+            except Exception:
+                pass
+
+        # Force the USB-serial latency timer to 1ms through sysfs as
+        # well (needs write access; the ioctl above usually suffices),
+        # then report the effective value
+        port_name = os.path.basename(self.device_name)
+        timer_path = f"/sys/bus/usb-serial/devices/{port_name}/latency_timer"
+        try:
+            with open(timer_path, 'w') as f:
+                f.write('1')
+        except OSError:
+            pass
+        try:
+            with open(timer_path) as f:
+                print(f"  USB-serial latency timer: {f.read().strip()}ms")
+        except OSError:
+            pass
+
     def connect(self) -> bool:
         """
         Connect to the servo bus.
@@ -128,6 +385,36 @@ class Robot:
                 print(f"Failed to set baudrate to {self.baudrate}")
                 return False
                 
+            # Minimize kernel-side serial batching before any traffic
+            self._enable_low_latency()
+
+            # Tighten the pyserial timeouts under the SDK so response
+            # reads return as soon as the frame is in (burst reads
+            # rather than worst-case blocking); the SDK still enforces
+            # its own per-packet timeout on top
+            try:
+                ser = getattr(self.port_handler, 'ser', None)
+                if ser is not None:
+                    ser.timeout = 0.002
+                    ser.inter_byte_timeout = 0.001
+            except Exception:
+                pass
+
+            # Group-write handles: one packet per bus update instead of
+            # one round-trip per servo
+            self._gsw_pos = GroupSyncWrite(
+                self.port_handler, self.packet_handler, self.GOAL_POSITION, 2
+            )
+            self._gsw_speed = GroupSyncWrite(
+                self.port_handler, self.packet_handler, self.GOAL_SPEED, 2
+            )
+            self._gsw_motion = GroupSyncWrite(
+                self.port_handler, self.packet_handler, self.GOAL_ACC, 7
+            )
+            self._gsw_acc = GroupSyncWrite(
+                self.port_handler, self.packet_handler, self.GOAL_ACC, 1
+            )
+
             self.is_connected = True
             print(f"✓ Connected to {self.device_name} at {self.baudrate} baud")
             return True
@@ -143,10 +430,11 @@ class Robot:
             for servo_id in DEFAULT_SERVOS.values():
                 try:
                     self.packet_handler.write1ByteTxRx(
-                        self.port_handler, servo_id["id"], ADDR_SCS_TORQUE_ENABLE, 0
+                        self.port_handler, servo_id["id"], self.TORQUE_ENABLE, 0
                     )
                 except:
                     pass
+            self._torque_on = False
             self.port_handler.closePort()
             self.is_connected = False
             print("✓ Disconnected safely")
@@ -154,11 +442,14 @@ class Robot:
     def has_calibration(self) -> bool:
         """
         Check if calibration data is available.
-        
+
+        The answer is cached when calibration is loaded or saved, so
+        hot paths don't stat the calibration file on every call.
+
         Returns:
             bool: True if calibration data exists, False otherwise
         """
-        return len(self.calibration) > 0 and os.path.exists(CALIBRATION_FILE)
+        return self._has_cal
     
     def load_calibration(self) -> bool:
         """
@@ -172,25 +463,24 @@ class Robot:
                 print(f"No calibration file found at {CALIBRATION_FILE}")
                 return False
                 
-            with open(CALIBRATION_FILE, 'r') as f:
-                cal_data = json.load(f)
+            with open(CALIBRATION_FILE, 'rb') as f:
+                raw = f.read()
+            cal_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
             self.calibration = {}
             self.servo_names = {}
             
-            for name, data in cal_data.items():
-                servo_id = data['id']
-                self.calibration[servo_id] = {
-                    'name': name,
-                    'id': servo_id,
-                    'drive_mode': data['drive_mode'],
-                    'homing_offset': data['homing_offset'],
-                    'range_min': data['range_min'],
-                    'range_max': data['range_max'],
-                    'range_size': data['range_max'] - data['range_min']
-                }
-                self.servo_names[servo_id] = name
-            
+            self.calibration = {
+                data['id']: _ServoCal(name=name, **data)
+                for name, data in cal_data.items()
+            }
+            self.servo_names = {
+                servo_id: cal.name
+                for servo_id, cal in self.calibration.items()
+            }
+
+            self._rebuild_cal_arrays()
+            self._has_cal = len(self.calibration) > 0
             print(f"✓ Loaded calibration for {len(self.calibration)} servos")
             return True
             
@@ -198,27 +488,49 @@ class Robot:
             print(f"Failed to load calibration: {e}")
             return False
     
-    def save_calibration(self) -> bool:
+    def save_calibration(self, pretty: bool = False) -> bool:
         """
         Save calibration data to file.
-        
+
+        The data is written to a temp file, fsynced and atomically
+        renamed over the old one, so a crash mid-write can never leave
+        a corrupt calibration behind (which would force a full
+        recalibration).
+
+        Args:
+            pretty: Indent the JSON for human-readable debugging
+                (slower; default is compact output)
+
         Returns:
             bool: True if calibration saved successfully, False otherwise
         """
         try:
             cal_data = {}
             for servo_id, cal in self.calibration.items():
-                cal_data[cal['name']] = {
-                    'id': cal['id'],
-                    'drive_mode': cal['drive_mode'],
-                    'homing_offset': cal['homing_offset'],
-                    'range_min': cal['range_min'],
-                    'range_max': cal['range_max']
+                cal_data[cal.name] = {
+                    'id': cal.id,
+                    'drive_mode': cal.drive_mode,
+                    'homing_offset': cal.homing_offset,
+                    'range_min': cal.range_min,
+                    'range_max': cal.range_max
                 }
             
-            with open(CALIBRATION_FILE, 'w') as f:
-                json.dump(cal_data, f, indent=4)
-            
+            if orjson is not None:
+                option = orjson.OPT_INDENT_2 if pretty else 0
+                payload = orjson.dumps(cal_data, option=option)
+            else:
+                payload = json.dumps(
+                    cal_data, indent=4 if pretty else None
+                ).encode()
+
+            tmp_file = CALIBRATION_FILE + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, CALIBRATION_FILE)
+
+            self._has_cal = len(self.calibration) > 0
             print(f"✓ Calibration saved to {CALIBRATION_FILE}")
             return True
             
@@ -226,6 +538,30 @@ class Robot:
             print(f"Failed to save calibration: {e}")
             return False
     
+    def _rebuild_cal_arrays(self):
+        """Precompute per-servo calibration arrays for vectorized math."""
+        sorted_ids = sorted(self.calibration.keys())
+        self._id_order = tuple(sorted_ids)
+        self._cal_list = tuple(self.calibration[i] for i in sorted_ids)
+        self._range_min_arr = np.array(
+            [cal.range_min for cal in self._cal_list], np.int32
+        )
+        self._range_max_arr = np.array(
+            [cal.range_max for cal in self._cal_list], np.int32
+        )
+        self._range_size_arr = self._range_max_arr - self._range_min_arr
+        self._cal_min = self._range_min_arr.astype(np.float32)
+        self._cal_inv100 = 100.0 / np.array(
+            [cal.range_size for cal in self._cal_list], np.float32
+        )
+        self._center_positions = (
+            (self._range_min_arr + self._range_max_arr) // 2
+        ).tolist()
+        self._status_headers = tuple(
+            f"{cal.name} (ID {servo_id}):\n"
+            for servo_id, cal in zip(self._id_order, self._cal_list)
+        )
+
     def setup_servo(self, servo_id: int, speed: int = 100, acceleration: int = 50) -> bool:
         """
         Setup a servo with specified parameters.
@@ -241,38 +577,116 @@ class Robot:
         try:
             # Set acceleration
             result, error = self.packet_handler.write1ByteTxRx(
-                self.port_handler, servo_id, ADDR_SCS_GOAL_ACC, acceleration
+                self.port_handler, servo_id, self.GOAL_ACC, acceleration
             )
             if result != COMM_SUCCESS or error != 0:
                 return False
                 
             # Set speed
             result, error = self.packet_handler.write2ByteTxRx(
-                self.port_handler, servo_id, ADDR_SCS_GOAL_SPEED, speed
+                self.port_handler, servo_id, self.GOAL_SPEED, speed
             )
             if result != COMM_SUCCESS or error != 0:
                 return False
                 
             # Enable torque
             result, error = self.packet_handler.write1ByteTxRx(
-                self.port_handler, servo_id, ADDR_SCS_TORQUE_ENABLE, 1
+                self.port_handler, servo_id, self.TORQUE_ENABLE, 1
             )
             if result != COMM_SUCCESS or error != 0:
                 return False
-                
+
+            # A single-servo setup invalidates the all-servo caches
+            self._last_speed = None
+            self._last_acc = None
+            self._last_goal.clear()
             return True
             
         except Exception as e:
             print(f"Setup failed for servo {servo_id}: {e}")
             return False
     
+    def get_all_servo_status(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Get the status of every servo in a single bus transaction.
+
+        The present position, speed, load, voltage and temperature
+        registers (56-63) are contiguous, so one 8-byte GroupSyncRead
+        covers the whole block for all servos. Falls back to per-servo
+        reads if the sync read fails.
+
+        Returns:
+            dict: Mapping of servo_id to status dicts with the same keys
+                as get_servo_status
+        """
+        if self.calibration:
+            servo_ids = self._id_order
+        else:
+            servo_ids = [cfg["id"] for cfg in DEFAULT_SERVOS.values()]
+
+        try:
+            if self._group_sync_read_status is None:
+                self._group_sync_read_status = GroupSyncRead(
+                    self.port_handler, self.packet_handler,
+                    self.PRESENT_POSITION, 8
+                )
+            gsr = self._group_sync_read_status
+            gsr.clearParam()
+            for servo_id in servo_ids:
+                gsr.addParam(servo_id)
+
+            if gsr.txRxPacket() == COMM_SUCCESS:
+                statuses = {}
+                for servo_id in servo_ids:
+                    status = {
+                        'position': None,
+                        'speed': None,
+                        'load': None,
+                        'voltage': None,
+                        'temperature': None,
+                        'error': None
+                    }
+                    if gsr.isAvailable(servo_id, self.PRESENT_POSITION, 4):
+                        # Decode the raw 8-byte register block in one
+                        # struct.unpack instead of per-field SDK helper
+                        # calls (SCS_LOWORD/SCS_HIWORD/SCS_TOHOST)
+                        raw = getattr(gsr, 'data_dict', {}).get(servo_id)
+                        if raw is not None and len(raw) >= 8:
+                            (position, speed_raw, load_raw, voltage_raw,
+                             temperature) = struct.unpack_from('<HHHBB', bytes(raw))
+                        else:
+                            pos_speed = gsr.getData(servo_id, self.PRESENT_POSITION, 4)
+                            position = pos_speed & 0xFFFF
+                            speed_raw = (pos_speed >> 16) & 0xFFFF
+                            load_raw = gsr.getData(servo_id, self.PRESENT_LOAD, 2)
+                            voltage_raw = gsr.getData(servo_id, self.PRESENT_VOLTAGE, 1)
+                            temperature = gsr.getData(servo_id, self.PRESENT_TEMPERATURE, 1)
+
+                        # Speed and load are sign-magnitude (bits 15 and
+                        # 10 are the sign bits), not two's complement
+                        status['position'] = position
+                        status['speed'] = -(speed_raw & 0x7FFF) if speed_raw & 0x8000 else speed_raw
+                        status['load'] = -(load_raw & 0x3FF) if load_raw & 0x400 else load_raw
+                        status['voltage'] = voltage_raw / 10.0
+                        status['temperature'] = temperature
+                    else:
+                        status['error'] = 'read failed'
+                    statuses[servo_id] = status
+                return statuses
+        except Exception:
+            pass
+
+        # Fall back to one read per servo
+        return {servo_id: self.get_servo_status(servo_id)
+                for servo_id in servo_ids}
+
     def get_servo_status(self, servo_id: int) -> Dict[str, Any]:
         """
         Get comprehensive status of a servo.
-        
+
         Args:
             servo_id: ID of the servo
-            
+
         Returns:
             dict: Servo status including position, speed, load, voltage, temperature
         """
@@ -288,7 +702,7 @@ class Robot:
         try:
             # Read position and speed
             pos_speed, result, error = self.packet_handler.read4ByteTxRx(
-                self.port_handler, servo_id, ADDR_SCS_PRESENT_POSITION
+                self.port_handler, servo_id, self.PRESENT_POSITION
             )
             if result == COMM_SUCCESS and error == 0:
                 status['position'] = SCS_LOWORD(pos_speed)
@@ -298,21 +712,21 @@ class Robot:
             
             # Read load
             load, result, error = self.packet_handler.read2ByteTxRx(
-                self.port_handler, servo_id, ADDR_SCS_PRESENT_LOAD
+                self.port_handler, servo_id, self.PRESENT_LOAD
             )
             if result == COMM_SUCCESS and error == 0:
                 status['load'] = SCS_TOHOST(load, 10)
             
             # Read voltage
             voltage, result, error = self.packet_handler.read1ByteTxRx(
-                self.port_handler, servo_id, ADDR_SCS_PRESENT_VOLTAGE
+                self.port_handler, servo_id, self.PRESENT_VOLTAGE
             )
             if result == COMM_SUCCESS and error == 0:
                 status['voltage'] = voltage / 10.0  # Convert to volts
             
             # Read temperature
             temp, result, error = self.packet_handler.read1ByteTxRx(
-                self.port_handler, servo_id, ADDR_SCS_PRESENT_TEMPERATURE
+                self.port_handler, servo_id, self.PRESENT_TEMPERATURE
             )
             if result == COMM_SUCCESS and error == 0:
                 status['temperature'] = temp
@@ -322,6 +736,97 @@ class Robot:
         
         return status
     
+    def set_torque_all(self, enable: bool) -> bool:
+        """
+        Enable or disable torque on all servos with one sync-write packet.
+
+        Packs every servo ID into a single GroupSyncWrite transaction
+        instead of one round-trip per servo, falling back to per-servo
+        writes if the sync write fails.
+
+        Args:
+            enable: True to enable torque, False to disable
+
+        Returns:
+            bool: True if the command reached all servos
+        """
+        value = 1 if enable else 0
+        servo_ids = [cfg["id"] for cfg in DEFAULT_SERVOS.values()]
+
+        # Toggling torque resets goal state on the servos
+        self._last_goal.clear()
+
+        try:
+            gsw = GroupSyncWrite(
+                self.port_handler, self.packet_handler, self.TORQUE_ENABLE, 1
+            )
+            for servo_id in servo_ids:
+                gsw.addParam(servo_id, [value])
+            if gsw.txPacket() == COMM_SUCCESS:
+                self._torque_on = enable
+                return True
+        except Exception:
+            pass
+
+        # Fall back to one write per servo
+        success = True
+        for servo_id in servo_ids:
+            try:
+                result, error = self.packet_handler.write1ByteTxRx(
+                    self.port_handler, servo_id, self.TORQUE_ENABLE, value
+                )
+                if result != COMM_SUCCESS or error != 0:
+                    success = False
+            except Exception:
+                success = False
+
+        self._torque_on = enable if success else False
+        return success
+
+    def _sync_read_positions(self) -> Dict[int, Optional[int]]:
+        """
+        Read the present position of all servos in one bus transaction.
+
+        Uses GroupSyncRead to fetch every servo's position with a single
+        packet instead of one round-trip per servo. Falls back to
+        per-servo reads if the sync read fails.
+
+        Returns:
+            dict: Mapping of servo_id to position (None for failed reads)
+        """
+        if self.calibration:
+            servo_ids = self._id_order
+        else:
+            servo_ids = [cfg["id"] for cfg in DEFAULT_SERVOS.values()]
+
+        try:
+            if self._group_sync_read_pos is None:
+                self._group_sync_read_pos = GroupSyncRead(
+                    self.port_handler, self.packet_handler,
+                    self.PRESENT_POSITION, 2
+                )
+            gsr = self._group_sync_read_pos
+            gsr.clearParam()
+            for servo_id in servo_ids:
+                gsr.addParam(servo_id)
+
+            if gsr.txRxPacket() == COMM_SUCCESS:
+                positions = {}
+                for servo_id in servo_ids:
+                    if gsr.isAvailable(servo_id, self.PRESENT_POSITION, 2):
+                        positions[servo_id] = gsr.getData(
+                            servo_id, self.PRESENT_POSITION, 2
+                        )
+                    else:
+                        positions[servo_id] = None
+                return positions
+        except Exception:
+            pass
+
+        # Fall back to one read per servo
+        return {servo_id: self.get_servo_status(servo_id)['position']
+                for servo_id in servo_ids}
+
     def move_servo(self, servo_id: int, position: int) -> bool:
         """
         Move servo to specified position.
@@ -335,7 +840,7 @@ class Robot:
         """
         try:
             result, error = self.packet_handler.write2ByteTxRx(
-                self.port_handler, servo_id, ADDR_SCS_GOAL_POSITION, position
+                self.port_handler, servo_id, self.GOAL_POSITION, position
             )
             
             if result != COMM_SUCCESS:
@@ -344,15 +849,84 @@ class Robot:
                 error_msg = self.packet_handler.getRxPacketError(error)
                 if "Overload error" in error_msg:
                     return False  # Overload detected
-                print(f"Warning for servo {servo_id}: {error_msg}")
+                log.debug("Warning for servo %d: %s", servo_id, error_msg)
                 return False
-            
+
+            self._last_goal[servo_id] = position
             return True
-            
+
         except Exception as e:
-            print(f"Exception moving servo {servo_id}: {e}")
+            log.debug("Exception moving servo %d: %s", servo_id, e)
             return False
     
+    def _sweep_gen(self, servo_id: int, start: int, limit: int, direction: int):
+        """
+        Generator form of the limit sweep, one probe per resume.
+
+        After each probe it yields the settle time that probe needs;
+        the caller owns the actual sleeping, which lets several sweeps
+        of mechanically independent joints interleave on the bus and
+        share a single settle delay per round. The generator's return
+        value is the last safe position reached.
+        """
+        last_safe = start
+
+        for step_idx, step in enumerate(SWEEP_STEPS):
+            overload_count = 0
+
+            for pos in _plan_probe_positions(last_safe, limit, direction, step):
+                pos = int(pos)
+                if self.move_servo(servo_id, pos):
+                    overload_count = 0
+                    last_safe = pos
+                    # Longer settle for the big coarse moves only
+                    yield 0.1 if step_idx == 0 else 0.02
+                else:
+                    overload_count += 1
+                    if overload_count >= OVERLOAD_THRESHOLD:
+                        break
+                    yield 0.0
+            else:
+                # Reached the absolute bound without overload
+                return last_safe
+
+            # Back off to the last safe position before refining
+            self.move_servo(servo_id, last_safe)
+            yield 0.1
+
+        return last_safe
+
+    def _run_sweeps(self, sweeps: Dict[int, Any]) -> Dict[int, int]:
+        """
+        Drive one or more sweep generators round-robin to completion.
+
+        Each round issues one probe per still-active sweep, then sleeps
+        once for the longest settle any of them requested, so N
+        interleaved joints share settle time instead of paying it
+        serially.
+
+        Args:
+            sweeps: Mapping of servo_id to a _sweep_gen generator
+
+        Returns:
+            dict: Mapping of servo_id to its detected limit position
+        """
+        results = {}
+        active = dict(sweeps)
+
+        while active:
+            settle = 0.0
+            for servo_id in list(active):
+                try:
+                    settle = max(settle, next(active[servo_id]))
+                except StopIteration as done:
+                    results[servo_id] = done.value
+                    del active[servo_id]
+            if settle > 0:
+                time.sleep(settle)
+
+        return results
+
     def detect_joint_limits(self, servo_id: int, servo_name: str) -> Tuple[int, int]:
         """
         Detect the physical limits of a joint by moving until overload errors occur.
@@ -364,72 +938,82 @@ class Robot:
         Returns:
             tuple: (min_position, max_position) or (None, None) if detection failed
         """
-        print(f"\n--- Calibrating {servo_name} (ID {servo_id}) ---")
-        
-        # Setup servo for calibration
-        if not self.setup_servo(servo_id, CALIBRATION_SPEED, CALIBRATION_ACC):
-            print(f"✗ Failed to setup {servo_name}")
-            return None, None
-        
-        # Get current position as starting point
-        status = self.get_servo_status(servo_id)
-        if status['position'] is None:
-            print(f"✗ Cannot read position for {servo_name}")
-            return None, None
-        
-        start_position = status['position']
-        print(f"Starting position: {start_position}")
-        
-        # Find minimum limit (move towards negative values)
-        print("Finding minimum limit...")
-        min_position = start_position
-        overload_count = 0
-        
-        for pos in range(start_position, MIN_POSITION - 1, -POSITION_STEP):
-            if not self.move_servo(servo_id, pos):
-                overload_count += 1
-                if overload_count >= OVERLOAD_THRESHOLD:
-                    min_position = pos + POSITION_STEP  # Last successful position
-                    print(f"✓ Minimum limit detected at: {min_position}")
-                    break
-            else:
-                overload_count = 0
-                time.sleep(0.1)  # Small delay between moves
-        else:
-            min_position = MIN_POSITION
-            print(f"✓ Reached absolute minimum: {min_position}")
-        
-        # Return to start position
+        return self._detect_limits_group([(servo_id, servo_name)])[servo_id]
+
+    def _detect_limits_group(self, joints: List[Tuple[int, str]]) -> Dict[int, Tuple]:
+        """
+        Detect limits for a group of mechanically independent joints.
+
+        All joints in the group sweep toward their minimum limits at the
+        same time (interleaved on the bus, sharing settle delays), then
+        all toward their maximums. With a single joint this behaves like
+        the classic sequential detection.
+
+        Args:
+            joints: List of (servo_id, servo_name) pairs
+
+        Returns:
+            dict: Mapping of servo_id to (min_position, max_position),
+                or (None, None) for joints that could not be calibrated
+        """
+        results = {servo_id: (None, None) for servo_id, _ in joints}
+        starts = {}
+
+        for servo_id, servo_name in joints:
+            print(f"\n--- Calibrating {servo_name} (ID {servo_id}) ---")
+
+            # Setup servo for calibration
+            if not self.setup_servo(servo_id, CALIBRATION_SPEED, CALIBRATION_ACC):
+                print(f"✗ Failed to setup {servo_name}")
+                continue
+
+            # Get current position as starting point
+            status = self.get_servo_status(servo_id)
+            if status['position'] is None:
+                print(f"✗ Cannot read position for {servo_name}")
+                continue
+
+            starts[servo_id] = status['position']
+            print(f"Starting position: {status['position']}")
+
+        if not starts:
+            return results
+
+        # Find minimum limits (coarse-to-fine sweeps towards negative values)
+        print("Finding minimum limits...")
+        min_positions = self._run_sweeps({
+            servo_id: self._sweep_gen(servo_id, start, MIN_POSITION, -1)
+            for servo_id, start in starts.items()
+        })
+
+        # Return to start positions
         time.sleep(0.5)
-        self.move_servo(servo_id, start_position)
+        for servo_id, start in starts.items():
+            self.move_servo(servo_id, start)
         time.sleep(1)
-        
-        # Find maximum limit (move towards 4095)
-        print("Finding maximum limit...")
-        max_position = start_position
-        overload_count = 0
-        
-        for pos in range(start_position, MAX_POSITION + 1, POSITION_STEP):
-            if not self.move_servo(servo_id, pos):
-                overload_count += 1
-                if overload_count >= OVERLOAD_THRESHOLD:
-                    max_position = pos - POSITION_STEP  # Last successful position
-                    print(f"✓ Maximum limit detected at: {max_position}")
-                    break
-            else:
-                overload_count = 0
-                time.sleep(0.1)  # Small delay between moves
-        else:
-            max_position = MAX_POSITION
-            print(f"✓ Reached absolute maximum: {max_position}")
-        
-        # Return to start position
+
+        # Find maximum limits (coarse-to-fine sweeps towards 4095)
+        print("Finding maximum limits...")
+        max_positions = self._run_sweeps({
+            servo_id: self._sweep_gen(servo_id, start, MAX_POSITION, 1)
+            for servo_id, start in starts.items()
+        })
+
+        # Return to start positions
         time.sleep(0.5)
-        self.move_servo(servo_id, start_position)
+        for servo_id, start in starts.items():
+            self.move_servo(servo_id, start)
         time.sleep(0.5)
-        
-        print(f"✓ {servo_name} limits: {min_position} to {max_position} (range: {max_position - min_position})")
-        return min_position, max_position
+
+        for servo_id, servo_name in joints:
+            if servo_id not in starts:
+                continue
+            min_position = min_positions[servo_id]
+            max_position = max_positions[servo_id]
+            results[servo_id] = (min_position, max_position)
+            print(f"✓ {servo_name} limits: {min_position} to {max_position} (range: {max_position - min_position})")
+
+        return results
     
     def manual_calibrate(self) -> bool:
         """
@@ -456,7 +1040,7 @@ class Robot:
             servo_id = servo_config["id"]
             try:
                 result, error = self.packet_handler.write1ByteTxRx(
-                    self.port_handler, servo_id, ADDR_SCS_TORQUE_ENABLE, 0
+                    self.port_handler, servo_id, self.TORQUE_ENABLE, 0
                 )
                 if result == COMM_SUCCESS and error == 0:
                     print(f"✓ {servo_name} (ID {servo_id}) torque disabled")
@@ -464,7 +1048,8 @@ class Robot:
                     print(f"⚠ {servo_name} (ID {servo_id}) may not be responding")
             except:
                 print(f"⚠ {servo_name} (ID {servo_id}) may not be responding")
-        
+        self._torque_on = False
+
         print("\n" + "="*60)
         print("MOVE JOINTS THROUGH FULL RANGE")
         print("="*60)
@@ -488,24 +1073,54 @@ class Robot:
         try:
             import select
             import sys
-            
+            import tty
+            import termios
+
+            sorted_ids = sorted(joint_ranges.keys())
+
             print("Joint Positions (move joints to see updates):")
             print("-" * 80)
-            
+            print("Press ENTER when done moving all joints...")
+            for servo_id in sorted_ids:
+                print(f"{joint_ranges[servo_id]['name']:12} (ID {servo_id}): waiting for data...")
+
+            # Character-at-a-time stdin so the stop key is seen the
+            # instant it is pressed, without a blocking input().
+            # Piped/scripted stdin has no termios; fall back to the
+            # line-based stop check there
+            stdin_fd = sys.stdin.fileno()
+            stdin_tty = os.isatty(stdin_fd)
+            saved_term = None
+            if stdin_tty:
+                saved_term = termios.tcgetattr(stdin_fd)
+                tty.setcbreak(stdin_fd)
+
+            # Pace against the clock instead of a fixed sleep per pass:
+            # the loop samples as fast as the batched read allows, up
+            # to ~100Hz, without drifting
+            tick = 0.01
+            next_tick = time.perf_counter() + tick
+
             while True:
-                # Check if user pressed enter
-                if select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], []):
-                    input()  # Consume the enter
+                # Check if user pressed enter (single-byte, non-blocking)
+                if select.select([sys.stdin], [], [], 0)[0]:
+                    if stdin_tty:
+                        if sys.stdin.read(1) in ('\r', '\n'):
+                            break
+                        continue
+                    input()  # Line-buffered stdin: consume the line
                     break
-                
-                # Read current positions and update ranges
+
+                # One bus transaction for all joints per tick
+                snapshot = self.get_all_servo_status()
+
                 updated = False
                 for servo_id, range_data in joint_ranges.items():
-                    status = self.get_servo_status(servo_id)
-                    if status['position'] is not None:
+                    status = snapshot.get(servo_id)
+                    if status is not None and status['position'] is not None:
                         current_pos = status['position']
                         range_data['current_pos'] = current_pos
-                        
+
                         # Update min/max
                         if range_data['min_pos'] is None or current_pos < range_data['min_pos']:
                             range_data['min_pos'] = current_pos
@@ -513,27 +1128,40 @@ class Robot:
                         if range_data['max_pos'] is None or current_pos > range_data['max_pos']:
                             range_data['max_pos'] = current_pos
                             updated = True
-                
-                # Print updated ranges if something changed
+
+                # Redraw only the joint lines, in place (no screen clear,
+                # no flicker): move the cursor up over the block and
+                # rewrite each line
                 if updated:
-                    print("\033[H\033[J", end="")  # Clear screen
-                    print("Joint Positions (move joints to see updates):")
-                    print("-" * 80)
-                    for servo_id in sorted(joint_ranges.keys()):
+                    lines = []
+                    for servo_id in sorted_ids:
                         range_data = joint_ranges[servo_id]
                         min_pos = range_data['min_pos'] if range_data['min_pos'] is not None else "---"
                         max_pos = range_data['max_pos'] if range_data['max_pos'] is not None else "---"
                         current = range_data['current_pos'] if range_data['current_pos'] is not None else "---"
                         range_size = (range_data['max_pos'] - range_data['min_pos']) if (range_data['min_pos'] is not None and range_data['max_pos'] is not None) else "---"
-                        print(f"{range_data['name']:12} (ID {servo_id}): Current={current:>5} | Min={min_pos:>5} | Max={max_pos:>5} | Range={range_size}")
-                    print("\nPress ENTER when done moving all joints...")
-                
-                time.sleep(0.1)  # Small delay
-                
+                        lines.append(f"{range_data['name']:12} (ID {servo_id}): Current={current:>5} | Min={min_pos:>5} | Max={max_pos:>5} | Range={range_size}\033[K")
+                    sys.stdout.write(f"\033[{len(lines)}A\r" + "\n".join(lines) + "\n")
+                    sys.stdout.flush()
+
+                delay = next_tick - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                    next_tick += tick
+                else:
+                    next_tick = time.perf_counter() + tick
+
         except KeyboardInterrupt:
             print("\nCalibration interrupted")
             return False
-        
+        finally:
+            # Restore line-buffered stdin for the input() prompts below
+            if saved_term is not None:
+                try:
+                    termios.tcsetattr(stdin_fd, termios.TCSADRAIN, saved_term)
+                except Exception:
+                    pass
+
         print("\n" + "="*60)
         print("SET HOME POSITION")
         print("="*60)
@@ -572,15 +1200,14 @@ class Robot:
                 homing_offset = home_pos - 2048  # Offset from theoretical center
                 
                 # Store calibration data
-                self.calibration[servo_id] = {
-                    'name': servo_name,
-                    'id': servo_id,
-                    'drive_mode': servo_config["drive_mode"],
-                    'homing_offset': homing_offset,
-                    'range_min': range_data['min_pos'],
-                    'range_max': range_data['max_pos'],
-                    'range_size': range_data['max_pos'] - range_data['min_pos']
-                }
+                self.calibration[servo_id] = _ServoCal(
+                    name=servo_name,
+                    id=servo_id,
+                    drive_mode=servo_config["drive_mode"],
+                    homing_offset=homing_offset,
+                    range_min=range_data['min_pos'],
+                    range_max=range_data['max_pos']
+                )
                 self.servo_names[servo_id] = servo_name
                 
                 print(f"✓ {servo_name} calibrated: {range_data['min_pos']} to {range_data['max_pos']} (home: {home_pos})")
@@ -588,6 +1215,7 @@ class Robot:
                 print(f"✗ Insufficient data for {servo_name}")
         
         if len(self.calibration) > 0:
+            self._rebuild_cal_arrays()
             # Save calibration to file
             if self.save_calibration():
                 print(f"\n✓ Manual calibration complete! Calibrated {len(self.calibration)} servos")
@@ -625,27 +1253,38 @@ class Robot:
         self.calibration = {}
         self.servo_names = {}
         
+        # Sweep mechanically independent joints concurrently when groups
+        # are configured; the default is one joint at a time
+        id_to_name = {cfg["id"]: name for name, cfg in DEFAULT_SERVOS.items()}
+        if INDEPENDENT_GROUPS:
+            groups = [sorted(g) for g in INDEPENDENT_GROUPS]
+        else:
+            groups = [[cfg["id"]] for cfg in DEFAULT_SERVOS.values()]
+
+        limits = {}
+        for group in groups:
+            limits.update(self._detect_limits_group(
+                [(servo_id, id_to_name[servo_id]) for servo_id in group]
+            ))
+
         for servo_name, servo_config in DEFAULT_SERVOS.items():
             servo_id = servo_config["id"]
-            
-            # Detect limits for this servo
-            min_pos, max_pos = self.detect_joint_limits(servo_id, servo_name)
-            
+            min_pos, max_pos = limits.get(servo_id, (None, None))
+
             if min_pos is not None and max_pos is not None:
                 # Calculate homing offset (center position)
                 center_pos = (min_pos + max_pos) // 2
                 homing_offset = center_pos - 2048  # Offset from theoretical center
                 
                 # Store calibration data
-                self.calibration[servo_id] = {
-                    'name': servo_name,
-                    'id': servo_id,
-                    'drive_mode': servo_config["drive_mode"],
-                    'homing_offset': homing_offset,
-                    'range_min': min_pos,
-                    'range_max': max_pos,
-                    'range_size': max_pos - min_pos
-                }
+                self.calibration[servo_id] = _ServoCal(
+                    name=servo_name,
+                    id=servo_id,
+                    drive_mode=servo_config["drive_mode"],
+                    homing_offset=homing_offset,
+                    range_min=min_pos,
+                    range_max=max_pos
+                )
                 self.servo_names[servo_id] = servo_name
                 
                 print(f"✓ {servo_name} calibrated successfully")
@@ -653,6 +1292,7 @@ class Robot:
                 print(f"✗ Failed to calibrate {servo_name}")
         
         if len(self.calibration) > 0:
+            self._rebuild_cal_arrays()
             # Save calibration to file
             if self.save_calibration():
                 print(f"\n✓ Auto-calibration complete! Calibrated {len(self.calibration)} servos")
@@ -689,129 +1329,627 @@ class Robot:
                 print("Please enter 1 or 2")
                 continue
     
+    def _apply_motion_params(self, speed: int, acceleration: int) -> bool:
+        """
+        Set speed/acceleration and enable torque on all servos, batched.
+
+        Uses one sync-write packet per register instead of three writes
+        per servo; falls back to per-servo setup_servo on failure.
+
+        Args:
+            speed: Movement speed (0-1000)
+            acceleration: Movement acceleration (0-255)
+
+        Returns:
+            bool: True if all servos were configured successfully
+        """
+        # Skip the bus entirely when nothing changed since the last call
+        if (speed == self._last_speed and acceleration == self._last_acc
+                and self._torque_on):
+            return True
+
+        sorted_ids = self._id_order
+
+        try:
+            ok = True
+
+            gsw = self._gsw_acc
+            gsw.clearParam()
+            for servo_id in sorted_ids:
+                gsw.addParam(servo_id, [acceleration])
+            ok &= gsw.txPacket() == COMM_SUCCESS
+
+            gsw = self._gsw_speed
+            gsw.clearParam()
+            for servo_id in sorted_ids:
+                gsw.addParam(servo_id, [SCS_LOBYTE(speed), SCS_HIBYTE(speed)])
+            ok &= gsw.txPacket() == COMM_SUCCESS
+
+            ok &= self.set_torque_all(True)
+            if ok:
+                self._last_speed = speed
+                self._last_acc = acceleration
+                return True
+        except Exception:
+            pass
+
+        # Fall back to one setup per servo
+        if all(self.setup_servo(servo_id, speed, acceleration)
+               for servo_id in sorted_ids):
+            self._last_speed = speed
+            self._last_acc = acceleration
+            self._torque_on = True
+            return True
+        return False
+
+    def _sync_write_positions(self, targets: List[Tuple[int, int]]) -> bool:
+        """
+        Send goal positions for several servos in one sync-write packet.
+
+        Servos whose goal register already holds the requested position
+        are left out of the frame entirely (goals persist until torque
+        is toggled), so consecutive near-identical trajectory ticks put
+        only the bytes that actually changed on the wire.
+
+        Args:
+            targets: List of (servo_id, position) pairs
+
+        Returns:
+            bool: True if the packet was transmitted successfully
+        """
+        try:
+            last_goal = self._last_goal
+            changed = [(servo_id, position) for servo_id, position in targets
+                       if last_goal.get(servo_id) != position]
+            if not changed:
+                return True
+
+            gsw = self._gsw_pos
+            gsw.clearParam()
+            for servo_id, position in changed:
+                # addParam keeps a reference to the data until
+                # txPacket serializes it, so each servo needs its own
+                # immutable copy — a shared buffer would alias every
+                # entry to the last position packed
+                gsw.addParam(servo_id, struct.pack('<H', position & 0xFFFF))
+
+            if gsw.txPacket() == COMM_SUCCESS:
+                last_goal.update(changed)
+                return True
+            return False
+        except Exception:
+            return False
+
+    def _sync_write_motion(self, targets: List[Tuple[int, int]],
+                           speed: int, acceleration: int) -> bool:
+        """
+        Send acceleration, goal position and speed in one frame per servo.
+
+        Registers 41-47 (GOAL_ACC, GOAL_POSITION, goal time, GOAL_SPEED)
+        are contiguous, so a single 7-byte sync write updates all three
+        motion parameters for every servo in one bus transaction instead
+        of three.
+
+        Args:
+            targets: List of (servo_id, position) pairs
+            speed: Movement speed (0-1000)
+            acceleration: Movement acceleration (0-255)
+
+        Returns:
+            bool: True if the packet was transmitted successfully
+        """
+        try:
+            gsw = self._gsw_motion
+            gsw.clearParam()
+            for servo_id, position in targets:
+                # Per-servo copy: addParam holds the data by reference
+                # until txPacket, so a shared buffer would alias every
+                # frame to the last servo's payload
+                gsw.addParam(servo_id, struct.pack(
+                    '<BHHH', acceleration & 0xFF,
+                    position & 0xFFFF, 0, speed & 0xFFFF
+                ))
+            if gsw.txPacket() == COMM_SUCCESS:
+                self._last_goal.update(targets)
+                return True
+            return False
+        except Exception:
+            return False
+
     def move_to_position(self, positions: List[int], speed: int = 100, acceleration: int = 50) -> bool:
         """
         Move all servos to specified positions simultaneously.
-        
+
         Args:
             positions: List of positions for each servo (by ID order 1-6)
             speed: Movement speed (0-1000)
             acceleration: Movement acceleration (0-255)
-            
+
         Returns:
             bool: True if all movements initiated successfully, False otherwise
         """
         if not self.has_calibration():
             print("✗ No calibration data available")
             return False
-        
+
         if len(positions) != len(self.calibration):
             print(f"✗ Expected {len(self.calibration)} positions, got {len(positions)}")
             return False
-        
-        # Setup all servos with new speed/acceleration
-        for servo_id in self.calibration.keys():
-            if not self.setup_servo(servo_id, speed, acceleration):
-                print(f"✗ Failed to setup servo {servo_id}")
-                return False
-        
-        # Send position commands to all servos
+
+        # Clamp all positions to their safe ranges in one vectorized op
+        requested = np.asarray(positions, dtype=np.int32)
+        safe = np.clip(requested, self._range_min_arr, self._range_max_arr)
+
+        if log.isEnabledFor(logging.DEBUG):
+            for i in np.flatnonzero(safe != requested):
+                name = self.calibration[self._id_order[i]].name
+                log.debug("Clamped %s: %d → %d", name, requested[i], safe[i])
+
+        targets = list(zip(self._id_order, safe.tolist()))
+
+        if (speed == self._last_speed and acceleration == self._last_acc
+                and self._torque_on):
+            # Motion params already on the servos: position-only frame
+            if self._sync_write_positions(targets):
+                return True
+        else:
+            # New speed/acceleration: one combined frame per servo
+            # carries acc + position + speed in a single transaction
+            if not self._torque_on:
+                self.set_torque_all(True)
+            if self._sync_write_motion(targets, speed, acceleration):
+                self._last_speed = speed
+                self._last_acc = acceleration
+                return True
+
+        # Combined or position frame failed; fall back to the split path
+        if not self._apply_motion_params(speed, acceleration):
+            print("✗ Failed to setup servos")
+            return False
+
+        if self._sync_write_positions(targets):
+            return True
+
+        # Fall back to one write per servo
         success = True
-        for i, servo_id in enumerate(sorted(self.calibration.keys())):
-            cal = self.calibration[servo_id]
-            target_pos = positions[i]
-            
-            # Clamp position to safe range
-            safe_pos = max(cal['range_min'], min(cal['range_max'], target_pos))
-            
-            if safe_pos != target_pos:
-                print(f"⚠ Clamped {cal['name']}: {target_pos} → {safe_pos}")
-            
+        for servo_id, safe_pos in targets:
             if not self.move_servo(servo_id, safe_pos):
-                print(f"✗ Failed to move {cal['name']}")
+                print(f"✗ Failed to move {self.calibration[servo_id].name}")
                 success = False
-        
+
         return success
     
-    def execute_waypoints(self, waypoints: List[List[int]], speed: int = 100, 
-                         acceleration: int = 50, wait_time: float = 2.0) -> bool:
+    def wait_for_reached(self, goals: List[int], tol: int = 8,
+                         timeout: float = 2.0, poll_dt: float = 0.02) -> bool:
+        """
+        Block until all servos are within tol of their goal positions.
+
+        Polls the batched position read and returns as soon as every
+        joint has converged, instead of sleeping a worst-case constant.
+        Clamped or stalled joints simply run out the timeout.
+
+        Args:
+            goals: Goal positions in sorted servo-ID order
+            tol: Maximum position error that counts as reached
+            timeout: Give-up time in seconds
+            poll_dt: Delay between position polls (seconds)
+
+        Returns:
+            bool: True if all joints converged within the timeout
+        """
+        goal_arr = np.asarray(goals, dtype=np.int32)
+        sorted_ids = self._id_order or tuple(sorted(self.calibration.keys()))
+        deadline = time.perf_counter() + timeout
+
+        while True:
+            position_map = self._sync_read_positions()
+            positions = [position_map.get(servo_id) for servo_id in sorted_ids]
+
+            if all(p is not None for p in positions):
+                errors = np.abs(np.asarray(positions, np.int32) - goal_arr)
+                if int(errors.max()) <= tol:
+                    return True
+
+            if time.perf_counter() >= deadline:
+                return False
+            time.sleep(poll_dt)
+
+    def wait_until_stopped(self, pos_tol: int = 3, timeout: float = 3.0,
+                           poll_dt: float = 0.02) -> bool:
+        """
+        Block until every servo has stopped moving.
+
+        Compares consecutive batched position reads and returns once no
+        joint moved more than pos_tol between polls — the goal-agnostic
+        companion to wait_for_reached, for when the commanded target
+        may have been clamped.
+
+        Args:
+            pos_tol: Maximum inter-poll movement that counts as stopped
+            timeout: Give-up time in seconds
+            poll_dt: Delay between position polls (seconds)
+
+        Returns:
+            bool: True if all joints stopped within the timeout
+        """
+        sorted_ids = self._id_order or tuple(sorted(self.calibration.keys()))
+        deadline = time.perf_counter() + timeout
+        previous = None
+
+        while True:
+            position_map = self._sync_read_positions()
+            positions = [position_map.get(servo_id) for servo_id in sorted_ids]
+
+            if all(p is not None for p in positions):
+                current = np.asarray(positions, np.int32)
+                if previous is not None:
+                    if int(np.abs(current - previous).max()) <= pos_tol:
+                        return True
+                previous = current
+
+            if time.perf_counter() >= deadline:
+                return False
+            time.sleep(poll_dt)
+
+    def execute_waypoints(self, waypoints: List[List[int]], speed: int = 100,
+                         acceleration: int = 50, wait_time: float = 2.0,
+                         stream: bool = False) -> bool:
         """
         Execute a sequence of waypoints.
-        
+
         Args:
-            waypoints: List of waypoints, each containing positions for all servos
+            waypoints: Waypoint list or (W, n_joints) array, each row
+                containing positions for all servos
             speed: Movement speed (0-1000)
             acceleration: Movement acceleration (0-255)
             wait_time: Time to wait at each waypoint (seconds)
-            
+            stream: Interpolate and stream the waypoints as one
+                continuous trajectory (no dwell stops) instead of
+                waiting at each waypoint
+
         Returns:
             bool: True if all waypoints executed successfully, False otherwise
         """
-        if not waypoints:
+        if len(waypoints) == 0:
             print("✗ No waypoints provided")
             return False
-        
+
+        if stream:
+            return self.execute_trajectory(waypoints, speed=speed,
+                                           acceleration=acceleration,
+                                           segment_time=wait_time)
+
         print(f"\n--- Executing {len(waypoints)} waypoints ---")
         print(f"Speed: {speed}, Acceleration: {acceleration}, Wait time: {wait_time}s")
-        
+
+        # Progress is buffered and flushed in one write after the run,
+        # keeping terminal I/O out of the motion command path
+        progress = []
+
         for i, waypoint in enumerate(waypoints):
-            print(f"\nWaypoint {i+1}/{len(waypoints)}: {waypoint}")
-            
+            progress.append(f"\nWaypoint {i+1}/{len(waypoints)}: {waypoint}")
+
             if not self.move_to_position(waypoint, speed, acceleration):
+                sys.stdout.write('\n'.join(progress) + '\n')
                 print(f"✗ Failed to reach waypoint {i+1}")
                 return False
-            
-            # Wait for movement to complete
-            time.sleep(wait_time)
-            
-            # Show current positions
-            print("Current positions:")
-            for servo_id in sorted(self.calibration.keys()):
-                cal = self.calibration[servo_id]
-                status = self.get_servo_status(servo_id)
-                if status['position'] is not None:
-                    print(f"  {cal['name']}: {status['position']}")
+
+            # Wait for movement to complete (early exit on convergence)
+            self.wait_for_reached(waypoint, timeout=wait_time)
+
+            # Record current positions (one batched read)
+            snapshot = self.read_all_status()
+            progress.append("Current positions:")
+            for servo_id, cal in zip(self._id_order, self._cal_list):
+                status = snapshot.get(servo_id)
+                if status is not None and status['position'] is not None:
+                    progress.append(f"  {cal.name}: {status['position']}")
                 else:
-                    print(f"  {cal['name']}: Error reading position")
-        
+                    progress.append(f"  {cal.name}: Error reading position")
+
+        sys.stdout.write('\n'.join(progress) + '\n')
         print("\n✓ All waypoints executed successfully")
         return True
-    
+
+    def execute_trajectory(self, waypoints: List[List[int]], dt: float = 0.02,
+                           speed: int = 1000, acceleration: int = 150,
+                           segment_time: float = 1.0) -> bool:
+        """
+        Execute waypoints as one continuous streamed trajectory.
+
+        Unlike execute_waypoints, which stops and dwells at every
+        waypoint, this interpolates a smooth joint-space path through
+        all of them (cubic spline with zero boundary velocity when
+        scipy is available, piecewise-linear otherwise) and streams the
+        dense samples over the bus at the requested rate. The robot
+        never decelerates to rest between waypoints.
+
+        Args:
+            waypoints: List of waypoints, each containing positions for all servos
+            dt: Time between streamed samples (seconds)
+            speed: Servo speed limit (0-1000)
+            acceleration: Servo acceleration limit (0-255)
+            segment_time: Nominal traversal time per waypoint segment (seconds)
+
+        Returns:
+            bool: True if the whole trajectory was streamed successfully
+        """
+        if not self.has_calibration():
+            print("✗ No calibration data available")
+            return False
+
+        if len(waypoints) == 0:
+            print("✗ No waypoints provided")
+            return False
+
+        wp = np.asarray(waypoints, np.float64)
+        if len(wp) == 1:
+            return self.move_to_position([int(p) for p in wp[0]],
+                                         speed, acceleration)
+
+        samples = None
+        if Ruckig is not None:
+            # Time-optimal jerk-limited profile through all waypoints
+            try:
+                samples = self._ruckig_samples(wp, dt, speed, acceleration)
+            except Exception as e:
+                log.debug("Ruckig sampling failed, falling back: %s", e)
+
+        if samples is None:
+            t_knots = np.arange(len(wp)) * segment_time
+            t_dense = np.arange(0.0, t_knots[-1] + dt / 2, dt)
+
+            if CubicSpline is not None:
+                dense = CubicSpline(t_knots, wp, bc_type='clamped')(t_dense)
+            else:
+                dense = np.stack(
+                    [np.interp(t_dense, t_knots, wp[:, j])
+                     for j in range(wp.shape[1])], axis=1
+                )
+            samples = np.rint(dense).astype(np.int32)
+
+        # Clamp the whole trajectory once so the send loop is pure I/O
+        samples = _clamp_block(samples, self._range_min_arr,
+                               self._range_max_arr)
+
+        print(f"\n--- Streaming trajectory: {len(wp)} waypoints, "
+              f"{len(samples)} samples at {dt * 1000:.0f}ms ---")
+
+        if not self._stream_samples(samples, dt, speed, acceleration):
+            print("✗ Trajectory streaming failed")
+            return False
+
+        self.wait_for_reached(samples[-1].tolist())
+        print("✓ Trajectory complete")
+        return True
+
+    def _ruckig_samples(self, wp: np.ndarray, dt: float,
+                        speed: int, acceleration: int) -> np.ndarray:
+        """
+        Sample a jerk-limited profile through the waypoints with Ruckig.
+
+        The profile starts and ends at rest, blends through the
+        intermediate waypoints and respects velocity/acceleration/jerk
+        bounds derived from the commanded servo limits, so there are no
+        torque spikes at waypoint boundaries.
+
+        Args:
+            wp: (W, n_joints) float waypoint matrix
+            dt: Control cycle time (seconds)
+            speed: Servo speed limit, used as max velocity (ticks/s)
+            acceleration: Servo acceleration limit, scaled to ticks/s^2
+
+        Returns:
+            np.ndarray: (N, n_joints) int32 dense sample matrix
+        """
+        n_joints = wp.shape[1]
+        n_intermediate = max(len(wp) - 2, 0)
+
+        otg = Ruckig(n_joints, dt, n_intermediate)
+        inp = InputParameter(n_joints)
+        out = OutputParameter(n_joints, n_intermediate)
+
+        inp.current_position = wp[0].tolist()
+        inp.current_velocity = [0.0] * n_joints
+        inp.current_acceleration = [0.0] * n_joints
+        if n_intermediate:
+            inp.intermediate_positions = wp[1:-1].tolist()
+        inp.target_position = wp[-1].tolist()
+        inp.target_velocity = [0.0] * n_joints
+        inp.target_acceleration = [0.0] * n_joints
+
+        v_max = float(max(speed, 1))
+        a_max = float(max(acceleration, 1)) * 100.0
+        inp.max_velocity = [v_max] * n_joints
+        inp.max_acceleration = [a_max] * n_joints
+        inp.max_jerk = [a_max * 10.0] * n_joints
+
+        samples = []
+        result = Result.Working
+        while result == Result.Working:
+            result = otg.update(inp, out)
+            samples.append(list(out.new_position))
+            out.pass_to_input(inp)
+
+        if result != Result.Finished:
+            raise RuntimeError(f"Ruckig returned {result}")
+
+        return np.rint(np.asarray(samples)).astype(np.int32)
+
+    def _stream_samples(self, samples: np.ndarray, dt: float,
+                        speed: int, acceleration: int) -> bool:
+        """
+        Stream dense trajectory samples through a bounded command queue.
+
+        A producer thread keeps a few blocks of upcoming samples queued
+        so the bus-facing loop always has look-ahead and the bus never
+        idles between waypoints. The consumer paces each sync write
+        against the trajectory clock (t0 + n*dt), so per-sample
+        overhead doesn't accumulate as drift.
+
+        Args:
+            samples: (W, n_joints) array of positions to stream
+            dt: Time between samples (seconds)
+            speed: Servo speed limit (0-1000)
+            acceleration: Servo acceleration limit (0-255)
+
+        Returns:
+            bool: True if every sample was sent successfully
+        """
+        # Motion params go out once; the per-tick path is then a single
+        # position frame on pre-clamped samples
+        if not self._apply_motion_params(speed, acceleration):
+            return False
+
+        block_size = 16
+        commands = queue.Queue(maxsize=4)
+
+        def produce():
+            for start in range(0, len(samples), block_size):
+                commands.put(samples[start:start + block_size])
+            commands.put(None)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        ids = self._id_order
+        sent = 0
+        ok = True
+        t0 = time.perf_counter()
+
+        while True:
+            block = commands.get()
+            if block is None:
+                break
+            for sample in block:
+                if not self._sync_write_positions(list(zip(ids, sample.tolist()))):
+                    # Sync write failed; retry through the checked path
+                    if not self.move_to_position(sample.tolist(), speed,
+                                                 acceleration):
+                        log.debug("Trajectory failed at sample %d/%d",
+                                  sent + 1, len(samples))
+                        ok = False
+                        break
+                sent += 1
+                delay = t0 + sent * dt - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            if not ok:
+                # Drain so the producer can finish and exit
+                while commands.get() is not None:
+                    pass
+                break
+
+        producer.join()
+        return ok
+
+    def read_all_status(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Read every servo's status in a single batched bus transaction.
+
+        One sync read covers the whole present_position..temperature
+        register block for all servos, instead of one request/response
+        round-trip per servo — the dominant cost on the half-duplex bus.
+
+        Returns:
+            dict: Mapping of servo_id to status dicts with the same keys
+                as get_servo_status
+        """
+        return self.get_all_servo_status()
+
+    def fast_range_test(self, delta_pct: float = 0.15, speed: int = 200,
+                        acceleration: int = 100) -> bool:
+        """
+        Quick calibration-verification sweep of all joints at once.
+
+        Builds one waypoint sequence where each row perturbs a single
+        joint by ±delta around center while the others hold, and plays
+        the whole thing as one interpolated stream — no per-joint
+        dwells, so the test takes roughly the time of one sweep instead
+        of one sweep per joint.
+
+        Args:
+            delta_pct: Sweep amplitude as a fraction of each joint's range
+            speed: Servo speed limit (0-1000)
+            acceleration: Servo acceleration limit (0-255)
+
+        Returns:
+            bool: True if the whole sweep streamed successfully
+        """
+        if not self.has_calibration():
+            print("✗ No calibration data available")
+            return False
+
+        centers = np.asarray(self._center_positions, dtype=np.int32)
+        deltas = (self._range_size_arr * delta_pct / 2).astype(np.int32)
+        n_joints = len(centers)
+
+        # One +delta and one -delta excursion per joint, centers between
+        waypoints = [centers]
+        for i in range(n_joints):
+            for sign in (1, -1):
+                wp = centers.copy()
+                wp[i] = centers[i] + sign * deltas[i]
+                waypoints.append(wp)
+            waypoints.append(centers)
+
+        print(f"\n--- Fast range test: {n_joints} joints, "
+              f"±{delta_pct * 100:.0f}% of range ---")
+        return self.execute_trajectory(
+            np.stack(waypoints), speed=speed,
+            acceleration=acceleration, segment_time=0.5
+        )
+
     def get_current_positions(self) -> List[int]:
         """
         Get current positions of all servos.
-        
+
         Returns:
             list: Current positions of all servos (by ID order 1-6)
         """
-        positions = []
-        for servo_id in sorted(self.calibration.keys()):
-            status = self.get_servo_status(servo_id)
-            positions.append(status['position'] if status['position'] is not None else 0)
-        return positions
-    
-    def print_status(self):
-        """Print comprehensive status of all servos."""
+        snapshot = self.read_all_status()
+        raw = np.array(
+            [snapshot[servo_id]['position'] if servo_id in snapshot else None
+             for servo_id in self._id_order], dtype=object
+        )
+        return np.where(np.equal(raw, None), 0, raw).astype(np.int32).tolist()
+
+    def print_status(self, snapshot: Optional[Dict[int, Dict[str, Any]]] = None):
+        """
+        Print comprehensive status of all servos.
+
+        Args:
+            snapshot: Status snapshot from read_all_status to display;
+                reads a fresh one when omitted
+        """
         if not self.has_calibration():
             print("No calibration data available")
             return
-        
-        print("\n--- Robot Status ---")
-        for servo_id in sorted(self.calibration.keys()):
-            cal = self.calibration[servo_id]
-            status = self.get_servo_status(servo_id)
-            
-            print(f"{cal['name']} (ID {servo_id}):")
+
+        if snapshot is None:
+            snapshot = self.read_all_status()
+
+        # Accumulate the whole report and emit it in one write instead
+        # of one syscall per line
+        parts = ["\n--- Robot Status ---\n"]
+        for header, servo_id, cal in zip(self._status_headers,
+                                         self._id_order, self._cal_list):
+            status = snapshot[servo_id]
+
+            parts.append(header)
             if status['position'] is not None:
-                range_pct = ((status['position'] - cal['range_min']) / cal['range_size']) * 100
-                print(f"  Position: {status['position']} ({range_pct:.1f}% of range)")
-                print(f"  Speed: {status['speed']}")
-                print(f"  Load: {status['load']}")
-                print(f"  Voltage: {status['voltage']}V")
-                print(f"  Temperature: {status['temperature']}°C")
+                range_pct = (status['position'] - cal.range_min) * cal.pct_scale
+                parts.append(
+                    f"  Position: {status['position']} ({range_pct:.1f}% of range)\n"
+                    f"  Speed: {status['speed']}\n"
+                    f"  Load: {status['load']}\n"
+                    f"  Voltage: {status['voltage']}V\n"
+                    f"  Temperature: {status['temperature']}°C\n\n"
+                )
             else:
-                print(f"  Error: {status['error']}")
-            print()
+                parts.append(f"  Error: {status['error']}\n\n")
+
+        sys.stdout.write(''.join(parts))
 
 
 def main():
@@ -836,57 +1974,58 @@ def main():
                 print("Cannot proceed without calibration")
                 return
         
-        # Show current status
-        robot.print_status()
-        
+        # One batched read serves both the status display and the
+        # starting-position capture
+        snapshot = robot.read_all_status()
+        robot.print_status(snapshot)
+
         # Full range of motion test - one joint at a time
         print("\nFull Range of Motion Test:")
-        current_pos = robot.get_current_positions()
+        current_pos = [snapshot[servo_id]['position'] or 0
+                       for servo_id in robot._id_order]
         print(f"Starting position: {current_pos}")
         
+        response = input("Run quick all-joint range check? (y/N): ").strip().lower()
+        if response == 'y':
+            if robot.fast_range_test():
+                print("✓ Quick range check complete")
+            else:
+                print("✗ Quick range check failed")
+
         response = input("Test full range of motion (one joint at a time) at speed 200? (y/N): ").strip().lower()
         if response == 'y':
+            # Centers come from the precomputed calibration arrays; one
+            # int32 vector shared by every joint test below
+            centers = np.asarray(robot._center_positions, dtype=np.int32)
+
             # Test each joint through its full range while keeping others at center
-            for i, servo_id in enumerate(sorted(robot.calibration.keys())):
+            for i, servo_id in enumerate(robot._id_order):
+                # Hoist the per-joint calibration fields to locals once
                 cal = robot.calibration[servo_id]
-                print(f"\n--- Testing {cal['name']} (Joint {i+1}) ---")
-                
-                # Calculate center positions for all other joints
-                center_positions = []
-                for j, other_servo_id in enumerate(sorted(robot.calibration.keys())):
-                    other_cal = robot.calibration[other_servo_id]
-                    center_pos = (other_cal['range_min'] + other_cal['range_max']) // 2
-                    center_positions.append(center_pos)
-                
-                # Create waypoints for this joint test
-                waypoints = []
-                
-                # 1. Move all joints to center
-                waypoints.append(center_positions.copy())
-                
-                # 2. Move test joint to minimum while others stay at center
-                min_waypoint = center_positions.copy()
-                min_waypoint[i] = cal['range_min']
-                waypoints.append(min_waypoint)
-                
-                # 3. Move test joint to maximum while others stay at center
-                max_waypoint = center_positions.copy()
-                max_waypoint[i] = cal['range_max']
-                waypoints.append(max_waypoint)
-                
-                # 4. Move test joint through 5 intermediate positions
-                for step in range(1, 6):  # 20%, 40%, 60%, 80%, 100% of range
-                    progress = step / 6.0
-                    intermediate_pos = int(cal['range_min'] + (cal['range_size'] * progress))
-                    intermediate_waypoint = center_positions.copy()
-                    intermediate_waypoint[i] = intermediate_pos
-                    waypoints.append(intermediate_waypoint)
-                
-                # 5. Return to center
-                waypoints.append(center_positions.copy())
-                
-                print(f"Testing {cal['name']} through {len(waypoints)} waypoints:")
-                print(f"  Range: {cal['range_min']} to {cal['range_max']} ({cal['range_size']} steps)")
+                name = cal.name
+                rmin = cal.range_min
+                rmax = cal.range_max
+                rsize = cal.range_size
+
+                print(f"\n--- Testing {name} (Joint {i+1}) ---")
+
+                # Build all waypoints for this joint in one broadcast:
+                # center pose, min, max, a minimum-jerk ramp of 5
+                # intermediates from min back up to max, then center —
+                # every row is the center pose with only column i
+                # overwritten
+                test_col = np.concatenate((
+                    [centers[i], rmin, rmax],
+                    _min_jerk_profile(rmin, rmax, 7)[1:-1],
+                    [centers[i]]
+                ))
+                # Pass the int32 matrix straight through; no per-row
+                # Python list materialization
+                waypoints = np.broadcast_to(centers, (test_col.size, centers.size)).copy()
+                waypoints[:, i] = test_col
+
+                print(f"Testing {name} through {len(waypoints)} waypoints:")
+                print(f"  Range: {rmin} to {rmax} ({rsize} steps)")
                 
                 # Execute waypoints for this joint
                 success = robot.execute_waypoints(
@@ -897,19 +2036,20 @@ def main():
                 )
                 
                 if success:
-                    print(f"✓ {cal['name']} full range test completed successfully")
+                    print(f"✓ {name} full range test completed successfully")
                 else:
-                    print(f"✗ {cal['name']} full range test failed")
+                    print(f"✗ {name} full range test failed")
                     break
                 
-                # Wait between joint tests
-                print("Waiting 3 seconds before next joint test...")
-                time.sleep(3)
-            
+                # Advance as soon as the arm has settled instead of a
+                # fixed 3-second pause
+                print("Waiting for joints to settle before next test...")
+                robot.wait_until_stopped(timeout=3.0)
+
             # Return to original starting position
             print(f"\n--- Returning to original starting position ---")
             robot.move_to_position(current_pos, speed=200, acceleration=100)
-            time.sleep(2)
+            robot.wait_for_reached(current_pos, timeout=2.0)
             print("✓ Full range of motion test complete!")
         
     except KeyboardInterrupt: